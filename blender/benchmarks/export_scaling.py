@@ -0,0 +1,59 @@
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+import bpy
+
+'''
+    Description:
+    ============
+    Times the SolidWire FBX export of subdivided grids of increasing size.
+    With the hash-indexed edge lookup, the time per triangle should stay roughly flat as the triangle count grows
+    (the old linear getEdgeData scan made it grow with the edge count instead).
+
+    Usage:
+    ======
+    blender -b --factory-startup --python blender/benchmarks/export_scaling.py
+'''
+
+# Number of grid subdivisions (per side) to benchmark. Each grid has 2 * (n - 1)^2 triangles.
+GRID_SIZES = [16, 32, 64, 128, 256]
+
+def loadExporter():
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+    module = importlib.import_module("io_export_solidwire_fbx")
+    module.register()
+    return module
+
+def clearScene():
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+def createGrid(size):
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=size, y_subdivisions=size, size=2)
+    return bpy.context.view_layer.objects.active
+
+def main():
+    loadExporter()
+
+    outputDir = tempfile.mkdtemp(prefix="solidwire_bench_")
+
+    print("%10s %12s %14s" % ("tris", "seconds", "us/tri"))
+    for size in GRID_SIZES:
+        clearScene()
+        obj = createGrid(size)
+        obj.select_set(True)
+
+        triCount = sum(len(p.vertices) - 2 for p in obj.data.polygons)
+
+        start = time.perf_counter()
+        # Without the cache (its entries are kept between runs, so every run after the first would only time restoring them).
+        bpy.ops.export_scene.solidwire_fbx(filepath=os.path.join(outputDir, "grid_%i.fbx" % size), use_cache=False)
+        elapsed = time.perf_counter() - start
+
+        print("%10i %12.3f %14.2f" % (triCount, elapsed, elapsed / triCount * 1e6))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+import argparse
+import contextlib
+import datetime
+import importlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+import numpy
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+'''
+    Description:
+    ============
+    Benchmark suite for the SolidWire FBX export. Generates synthetic meshes at several scales and times every stage of the export:
+    - evaluate:     Copying each object's evaluated mesh (with its modifiers applied).
+    - triangulate:  triangulateObject().
+    - looseEdges:   convertLooseEdges().
+    - readMesh:     Reading the mesh's arrays for the encoding.
+    - cornerEdges, fakeEdges, edgeTypes, encode, adjacency:
+                    The stages of encoding.encode() (encode is the UV/vertex color encoding).
+    - writeMesh:    Writing the UVs and vertex colors back to the mesh.
+    - fbx:          Writing the .fbx.
+    - operator:     The whole export_scene.solidwire_fbx operator (without the cache), end to end.
+    Each case is run --repeat times and the fastest time of each stage is kept.
+    The case is then run once more with tracemalloc to record its peak (Python and numpy) memory use.
+
+    Usage:
+    ======
+    blender -b --factory-startup --python blender/benchmarks/export_suite.py -- [--scale small|medium|large] [--output FILE] [--compare FILE]
+    python blender/benchmarks/export_suite.py --core-only [...]
+
+    --core-only only benchmarks the encoding (the stages that don't need Blender), using numpy generated meshes.
+    It's used automatically when the script isn't run by Blender.
+    --chunk-size N encodes the core-only meshes N corners at a time (see encoding.encode()), to compare their peak memory.
+
+    Results:
+    ========
+    A JSON object with the commit, Blender/Python versions and settings used, and for each case: its mesh counts,
+    the seconds spent in each stage, its peak traced memory ("peakBytes") and the process' peak RSS after the case ("maxRssBytes").
+    Pass the results of another commit with --compare to print the change in every stage's time.
+'''
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The cases run at each scale, as (mesh type, size). What size means depends on the type (see CASE_BUILDERS).
+SCALES = {
+    "small": [("grid", 32), ("ico", 4), ("lattice", 8), ("multimat", 32), ("rigged", 32)],
+    "medium": [("grid", 128), ("ico", 6), ("lattice", 20), ("multimat", 128), ("rigged", 128)],
+    "large": [("grid", 384), ("ico", 7), ("lattice", 40), ("multimat", 384), ("rigged", 384)],
+}
+
+MATERIAL_COUNT = 8      # Materials used by the multimat meshes.
+VERTEX_GROUP_COUNT = 64 # Vertex groups used by the rigged meshes (each vert is weighted to 4 of them).
+
+def loadExporter():
+    sys.path.insert(0, os.path.join(BENCHMARK_DIR, os.pardir))
+    module = importlib.import_module("io_export_solidwire_fbx")
+    importlib.import_module("io_export_solidwire_fbx.encoding")
+    importlib.import_module("io_export_solidwire_fbx.timing")
+    if bpy:
+        module.register() # Imports export_fbx as well.
+    return module
+
+def getCommit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=BENCHMARK_DIR, universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def getMaxRss():
+    if not resource:
+        return None
+
+    # ru_maxrss is in kilobytes on Linux, and bytes on macOS.
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxRss if sys.platform == "darwin" else maxRss * 1024
+
+# Runs fn() repeat times, and returns the fastest time of each of its stages.
+# fn is given a timing.StageTimer, and returns the case's mesh counts.
+def timeCase(fn, repeat, timing):
+    best = {}
+    counts = None
+    for i in range(repeat):
+        timer = timing.StageTimer()
+        counts = fn(timer)
+        for stage, seconds in timer.seconds.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+
+    return best, counts
+
+# Runs fn() once with tracemalloc, and returns the peak traced memory.
+def measureCase(fn, timing):
+    tracemalloc.start()
+    try:
+        fn(timing.StageTimer())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# Blender meshes
+# -------------------------------------------------------------------------------
+def clearScene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    for material in list(bpy.data.materials):
+        bpy.data.materials.remove(material)
+    for armature in list(bpy.data.armatures):
+        bpy.data.armatures.remove(armature)
+
+# Marks a spread of the mesh's edges as sharp and as seams, so every edge type is encoded.
+def markEdges(mesh):
+    edgeCount = len(mesh.edges)
+    index = numpy.arange(edgeCount)
+    mesh.edges.foreach_set("use_edge_sharp", index % 7 == 0)
+    mesh.edges.foreach_set("use_seam", index % 11 == 0)
+
+def createGrid(size):
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=size, y_subdivisions=size, size=2)
+    obj = bpy.context.view_layer.objects.active
+    markEdges(obj.data)
+    return obj
+
+def createIco(subdivisions):
+    bpy.ops.mesh.primitive_ico_sphere_add(subdivisions=subdivisions)
+    obj = bpy.context.view_layer.objects.active
+    markEdges(obj.data)
+    return obj
+
+# A size^3 lattice of loose edges (no faces at all).
+def createLattice(size):
+    verts = [(x, y, z) for x in range(size) for y in range(size) for z in range(size)]
+    edges = []
+    for i, (x, y, z) in enumerate(verts):
+        if x + 1 < size:
+            edges.append((i, i + size * size))
+        if y + 1 < size:
+            edges.append((i, i + size))
+        if z + 1 < size:
+            edges.append((i, i + 1))
+
+    mesh = bpy.data.meshes.new("lattice")
+    mesh.from_pydata(verts, edges, [])
+    obj = bpy.data.objects.new("lattice", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+def createMultiMaterial(size):
+    obj = createGrid(size)
+    for i in range(MATERIAL_COUNT):
+        material = bpy.data.materials.new("mat%i" % i)
+        material.diffuse_color = (i / MATERIAL_COUNT, 1 - i / MATERIAL_COUNT, 0.5, 1)
+        obj.data.materials.append(material)
+
+    polyCount = len(obj.data.polygons)
+    obj.data.polygons.foreach_set("material_index", numpy.arange(polyCount) % MATERIAL_COUNT)
+    return obj
+
+# A grid with an armature modifier, and every vert weighted to 4 of its VERTEX_GROUP_COUNT vertex groups.
+def createRigged(size):
+    obj = createGrid(size)
+
+    armature = bpy.data.armatures.new("rig")
+    rig = bpy.data.objects.new("rig", armature)
+    bpy.context.scene.collection.objects.link(rig)
+    modifier = obj.modifiers.new("Armature", 'ARMATURE')
+    modifier.object = rig
+
+    groups = [obj.vertex_groups.new(name="group%i" % i) for i in range(VERTEX_GROUP_COUNT)]
+    vertCount = len(obj.data.vertices)
+    for i in range(vertCount):
+        for j in range(4):
+            groups[(i + j * 17) % VERTEX_GROUP_COUNT].add([i], 0.25, 'REPLACE')
+
+    return obj
+
+CASE_BUILDERS = {
+    "grid": createGrid,         # size = subdivisions per side
+    "ico": createIco,           # size = ico sphere subdivisions
+    "lattice": createLattice,   # size = verts per side
+    "multimat": createMultiMaterial,
+    "rigged": createRigged,
+}
+
+# Writes the .fbx for obj, with its data swapped for the (processed) mesh the way the operator does.
+def writeFbx(obj, mesh, filepath):
+    originalData = obj.data
+    obj.data = mesh
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            bpy.ops.export_scene.fbx(
+                {"selected_objects": [obj]},
+                filepath=filepath,
+                use_selection=True,
+                use_mesh_modifiers=False,
+                use_metadata=True,
+                apply_scale_options='FBX_SCALE_UNITS',
+                bake_space_transform=True,
+            )
+    finally:
+        obj.data = originalData
+
+def runBlenderCase(exporter, obj, filepath, timer):
+    export_fbx = exporter.export_fbx
+
+    with timer.stage("evaluate"):
+        mesh = export_fbx.getEvaluatedMeshes(bpy.context, [obj])[0]
+
+    try:
+        export_fbx.buildSolidWireMesh(mesh, export_fbx.getMaterialColors(obj), timer=timer)
+        counts = {"verts": len(mesh.vertices), "edges": len(mesh.edges), "tris": len(mesh.polygons)}
+
+        with timer.stage("fbx"):
+            writeFbx(obj, mesh, filepath)
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+    for o in bpy.context.view_layer.objects:
+        o.select_set(False)
+    obj.select_set(True)
+
+    with timer.stage("operator"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            bpy.ops.export_scene.solidwire_fbx(filepath=filepath, use_cache=False)
+
+    return counts
+
+def runBlenderCases(exporter, cases, repeat, outputDir):
+    results = []
+    for kind, size in cases:
+        clearScene()
+        obj = CASE_BUILDERS[kind](size)
+        filepath = os.path.join(outputDir, "%s_%i.fbx" % (kind, size))
+        fn = lambda timer: runBlenderCase(exporter, obj, filepath, timer)
+
+        stages, counts = timeCase(fn, repeat, exporter.timing)
+        results.append(dict(name=kind, size=size, stages=stages, peakBytes=measureCase(fn, exporter.timing), maxRssBytes=getMaxRss(), **counts))
+        printCase(results[-1])
+
+    return results
+
+
+# Core-only meshes
+# -------------------------------------------------------------------------------
+# Returns the edges of the tris (the unique unordered pairs of their verts), as Blender would have them.
+def getEdges(tris):
+    pairs = numpy.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]])
+    return numpy.unique(numpy.sort(pairs, axis=1), axis=0)
+
+# A triangulated size x size grid, with a spread of sharp and seam edges and 8 materials.
+def gridArrays(size):
+    x, y = numpy.meshgrid(numpy.arange(size), numpy.arange(size))
+    co = numpy.stack([x.ravel(), y.ravel(), numpy.zeros(size * size)], axis=1).astype(numpy.float32)
+
+    quads = (numpy.arange(size - 1)[None, :] + numpy.arange(size - 1)[:, None] * size).ravel()
+    tris = numpy.concatenate([
+        numpy.stack([quads, quads + 1, quads + size + 1], axis=1),
+        numpy.stack([quads, quads + size + 1, quads + size], axis=1),
+    ]).astype(numpy.int32)
+    return co, tris
+
+# A size^3 lattice of loose edges, after convertLooseEdges() (each edge is a tri with a duplicate of its first vert).
+def latticeArrays(size):
+    x, y, z = numpy.meshgrid(numpy.arange(size), numpy.arange(size), numpy.arange(size), indexing="ij")
+    co = numpy.stack([x.ravel(), y.ravel(), z.ravel()], axis=1).astype(numpy.float32)
+    index = numpy.arange(size ** 3).reshape(size, size, size)
+
+    edges = numpy.concatenate([
+        numpy.stack([index[:-1, :, :].ravel(), index[1:, :, :].ravel()], axis=1),
+        numpy.stack([index[:, :-1, :].ravel(), index[:, 1:, :].ravel()], axis=1),
+        numpy.stack([index[:, :, :-1].ravel(), index[:, :, 1:].ravel()], axis=1),
+    ])
+
+    newVerts = numpy.arange(len(co), len(co) + len(edges))
+    co = numpy.concatenate([co, co[edges[:, 0]]])
+    tris = numpy.stack([edges[:, 0], edges[:, 1], newVerts], axis=1).astype(numpy.int32)
+    return co, tris
+
+CORE_CASE_BUILDERS = {
+    "grid": gridArrays,
+    "lattice": latticeArrays,
+}
+
+CORE_SCALES = {
+    "small": [("grid", 32), ("lattice", 8)],
+    "medium": [("grid", 128), ("lattice", 20)],
+    "large": [("grid", 384), ("lattice", 40)],
+}
+
+def runCoreCases(exporter, cases, repeat, chunkSize=0, minimiseVerts=False):
+    encoding = exporter.encoding
+
+    results = []
+    for kind, size in cases:
+        co, tris = CORE_CASE_BUILDERS[kind](size)
+        edges = getEdges(tris)
+        index = numpy.arange(len(edges))
+        matColors = [(i / MATERIAL_COUNT, 1 - i / MATERIAL_COUNT, 0.5, 1) for i in range(MATERIAL_COUNT)]
+        faceMats = numpy.arange(len(tris)) % MATERIAL_COUNT
+
+        def fn(timer):
+            encoding.encode(co, tris, edges, index % 7 == 0, index % 11 == 0, faceMats, matColors, minimiseVerts=minimiseVerts, chunkSize=chunkSize, timer=timer)
+            return {"verts": len(co), "edges": len(edges), "tris": len(tris)}
+
+        stages, counts = timeCase(fn, repeat, exporter.timing)
+        results.append(dict(name=kind, size=size, stages=stages, peakBytes=measureCase(fn, exporter.timing), maxRssBytes=getMaxRss(), **counts))
+        printCase(results[-1])
+
+    return results
+
+
+# Results
+# -------------------------------------------------------------------------------
+def printCase(case):
+    total = sum(case["stages"].get(s, 0.0) for s in case["stages"] if s != "operator")
+    print("%-10s %6i %10i tris %10.3f s %10.1f MiB peak" % (case["name"], case["size"], case["tris"], total, case["peakBytes"] / 2 ** 20))
+    for stage, seconds in case["stages"].items():
+        print("    %-12s %10.4f s" % (stage, seconds))
+
+# Prints the change in every stage's time against the results of another run.
+def printComparison(results, baselinePath):
+    with open(baselinePath) as f:
+        baseline = json.load(f)
+    baselineCases = {(c["name"], c["size"]): c for c in baseline["cases"]}
+
+    print("Compared to %s (%s):" % (baselinePath, baseline.get("commit")))
+    for case in results["cases"]:
+        old = baselineCases.get((case["name"], case["size"]))
+        if not old:
+            continue
+        for stage, seconds in case["stages"].items():
+            oldSeconds = old["stages"].get(stage)
+            if oldSeconds:
+                print("%-10s %6i %-12s %10.4f s -> %10.4f s (%+6.1f%%)" % (
+                    case["name"], case["size"], stage, oldSeconds, seconds, (seconds / oldSeconds - 1) * 100))
+
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(prog="export_suite", description="Benchmark the SolidWire FBX export.")
+    parser.add_argument("--scale", default="small", choices=sorted(SCALES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file")
+    parser.add_argument("--compare", default=None, help="JSON results of another run to compare against")
+    parser.add_argument("--core-only", action="store_true", help="Only benchmark the encoding (doesn't need Blender)")
+    parser.add_argument("--chunk-size", type=int, default=0, help="Corners encoded at once by the core-only cases (0 is all at once)")
+    parser.add_argument("--minimise-verts", action="store_true", help="Minimise the Unity vert count in the core-only cases")
+    return parser.parse_args(argv)
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    args = parseArgs(argv)
+    coreOnly = args.core_only or not bpy
+
+    exporter = loadExporter()
+
+    if coreOnly:
+        cases = runCoreCases(exporter, CORE_SCALES[args.scale], args.repeat, args.chunk_size, args.minimise_verts)
+    else:
+        cases = runBlenderCases(exporter, SCALES[args.scale], args.repeat, tempfile.mkdtemp(prefix="solidwire_bench_"))
+
+    results = {
+        "commit": getCommit(),
+        "date": datetime.datetime.now().isoformat(),
+        "blender": bpy.app.version_string if bpy else None,
+        "python": platform.python_version(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "coreOnly": coreOnly,
+        "chunkSize": args.chunk_size,
+        "minimiseVerts": args.minimise_verts,
+        "cases": cases,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        printComparison(results, args.compare)
+
+if __name__ == "__main__":
+    main()
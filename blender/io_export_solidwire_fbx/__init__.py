@@ -0,0 +1,46 @@
+bl_info = {
+    "name": "Export SolidWire FBX",
+    "blender": (2, 92, 0),
+    "category": "Object",
+}
+
+'''
+    Author:
+    =======
+    Milun
+
+    Compatibility:
+    ==============
+    This script was written for Blender v2.92.
+    
+    Description:
+    ============
+    This script needs to be applied to all meshes that will have the SolidWire material applied to them in Unity.
+    Upon being applied, it will (for each selected mesh):
+    - Triangulate the mesh.
+    - Set the normals to smooth on the mesh.
+    - Set the UV.x value for each vert in the mesh to be equal to its mesh index (aka, verts[9].UV.x = 9).
+    - Set the UV.y value for each vert in the mesh to the type of edge it has.
+        - In the 3D view, mark each edge as either smooth (LNORMAL), sharp (LALWAYS) or as a seam (LHIDE) to set its render type for Unity.
+    - For each loose edge, it will convert it to a tri with the new vert being in the same location as vert[0].
+        - The two new edges that were generated to make the tri will be marked as having the LNEVER type in Unity (meaning they will never be drawn).
+        - These two new edges are referred to below as "fake" edges, as their only purpose is to allow the loose edges to be imported into Unity.
+    The selected objects themselves are never modified. All of the above is done on a temporary copy of each object's evaluated mesh
+    (with its modifiers applied), which is only swapped onto the object while the .fbx is being written.
+    With the "SolidWire Mesh" format, the meshes are written straight to a .swmesh file instead (see swmesh.py), which Unity imports
+    with SolidWireMeshImporter. This skips the FBX exporter entirely, but only writes what the Unity side uses.
+    
+    TODO:
+    =====
+    - This script is can probably be made much more efficient and/or flexible (it's literally one of the first Blender scripts I've ever written). 
+'''
+
+# The exporter (and bpy) is only imported when the add-on is registered,
+# so the Blender-independent modules of this package (e.g. encoding) can be imported without Blender.
+def register():
+    from . import export_fbx
+    export_fbx.register()
+
+def unregister():
+    from . import export_fbx
+    export_fbx.unregister()
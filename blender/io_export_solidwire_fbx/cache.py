@@ -0,0 +1,90 @@
+import os
+import tempfile
+import zipfile
+import numpy
+
+'''
+    Description:
+    ============
+    Persistent on-disk cache of encoded SolidWire meshes, so objects that haven't changed since they were last exported aren't processed again.
+    What is stored for each mesh (and how it's keyed) is up to the caller; see hashMesh() and getMeshArrays() in export_fbx.py.
+
+    Concurrency:
+    ============
+    Several exports (e.g. the workers of solidwire_batch.py) can share a cache directory. Entries are written under a unique temporary name
+    and then renamed into place, entries removed by another process are skipped, and an unreadable entry is just a cache miss.
+'''
+
+# Encoded meshes are cached here (unless another directory is chosen in the export options).
+# CACHE_VERSION needs to be increased whenever a change to the script changes the encoded meshes, so that old entries aren't reused.
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "solidwire_cache")
+CACHE_VERSION = 3
+
+# Persistent on-disk cache of encoded SolidWire meshes (see getMeshArrays()), keyed by hashMesh().
+# Once the cache grows beyond maxBytes, the least recently used entries are removed.
+class ExportCache:
+    def __init__(self, directory, maxBytes):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def getPath(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    # Returns the cached arrays for the key (or None if they aren't cached).
+    def load(self, key):
+        path = self.getPath(key)
+        try:
+            with numpy.load(path) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+            self.misses += 1
+            return None
+
+        # Mark the entry as recently used (unless another process has evicted it since).
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return arrays
+
+    def store(self, key, arrays):
+        path = self.getPath(key)
+
+        # Write to a (uniquely named) temporary file first, so a partially written entry is never loaded.
+        fd, tempPath = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                numpy.savez(f, **arrays)
+            os.replace(tempPath, path)
+        except BaseException:
+            os.remove(tempPath)
+            raise
+
+        self.evict()
+
+    # Removes the least recently used entries until the cache fits in maxBytes.
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(e[1] for e in entries)
+        for mtime, size, name in sorted(entries):
+            if total <= self.maxBytes:
+                break
+            total -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            self.evictions += 1
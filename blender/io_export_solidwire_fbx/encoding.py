@@ -0,0 +1,474 @@
+import numpy
+
+from .timing import NULL_TIMER
+
+'''
+    Description:
+    ============
+    The Blender-independent part of the SolidWire export.
+    Given a triangulated mesh (with its loose edges already converted to tris) as plain arrays, this works out the type of every edge,
+    and the UVs and vertex colors every corner of the mesh needs for the SolidWire shader in Unity.
+    Nothing in here uses bpy, so it can be profiled, tested and benchmarked without Blender.
+
+    Corners:
+    ========
+    Corner k of tri f is at index f * 3 + k (the same order as the loops of a triangulated Blender mesh).
+    Edge k of a tri is the edge from its corner k to its corner k + 1.
+    Corners with the same vert, edge type and material become the same vert in Unity (see minimiseCorners()).
+    Everything is held in typed numpy arrays (one per field; see EdgeTable) rather than in Python objects, so a mesh with millions of tris
+    only needs a few arrays the size of its corners.
+'''
+
+# Values set to the UV y value of each vert to indicate what type of edge it has.
+# -------------------------------------------------------------------------------
+LNEVER = -1  # Never draw (Special. Only used with "fake" edges).
+LHIDE = 0 # Never draw
+LNORMAL = 1 # Draw when an edge
+LALWAYS = 2 # Always draw if not culled
+
+# With the packed index layout, a vert's mesh index is split across UV0.x, UV1.x and UV1.y in base PACK_BASE digits.
+# Every digit (and the edge type in UV0.y) is a whole number no bigger than 2048, so it survives being stored at half precision
+# (which is what Unity's mesh compression does to UVs).
+PACK_BASE = 2048
+
+# The most rounds of swaps minimiseCorners() makes (it usually runs out of swaps that help well before this).
+MAX_MINIMISE_ROUNDS = 64
+
+# Names of the edge types (used in reports).
+EDGE_TYPE_NAMES = {
+    LNEVER: "never",
+    LHIDE: "hide",
+    LNORMAL: "normal",
+    LALWAYS: "always",
+}
+
+# A record of the edge buffer (see getEdgeRecords()). Matches SolidWire.Edge in Unity.
+EDGE_RECORD = numpy.dtype([
+    ("v0", "<i4"), ("v1", "<i4"),       # The vert indexes of the edge.
+    ("type", "<i4"),                    # The type of the edge (LALWAYS edges aren't de-duplicated, as every edge is only in the buffer once).
+    ("tri0", "<i4"), ("tri1", "<i4"),   # The (first) two tris of the edge (or -1).
+    ("color", "<f4", 4),                # The color of the edge's material.
+])
+
+# The edges of a mesh, as a struct of arrays (one typed array per field, rather than an object per edge).
+class EdgeTable:
+    def __init__(self, verts, types, mats, fake):
+        self.verts = verts  # (edges, 2) int32. The vert indexes of each edge.
+        self.types = types  # (edges,) int8. The type of each edge.
+        self.mats = mats    # (edges,) int32. The lowest material index of the edge's tris (it takes priority).
+        self.fake = fake    # (edges,) bool. Whether each edge is "fake".
+
+# The result of encode().
+class EncodedMesh:
+    def __init__(self, uvs, colors, edgeTypes, fakeEdges, triAdjs, vertCounts=None, culledEdges=0, edgeRecords=None):
+        self.uvs = uvs              # (corners, 2) float32. UV.x is the vert's mesh index, UV.y is the edge type.
+        self.colors = colors        # (corners, 4) float32. The material color of each corner's edge.
+        self.edgeTypes = edgeTypes  # (edges,) int8. Type of each edge (after LALWAYS edges have been de-duplicated).
+        self.fakeEdges = fakeEdges  # (edges,) bool. Whether each edge is "fake".
+        self.triAdjs = triAdjs      # (corners,) int32. Each tri's 3 adjacent tri indexes (or -1 if there's no adjacent tri on an edge).
+        self.vertCounts = vertCounts # Number of unique corners before and after minimiseCorners() (or None if it wasn't used).
+        self.culledEdges = culledEdges # Number of LNORMAL edges changed to LHIDE by cullFlatEdges().
+        self.edgeRecords = edgeRecords # (edges,) EDGE_RECORD. The edge buffer (see getEdgeRecords()), or None if it wasn't made.
+
+# Returns the ranges of corners to process at once (all of them if chunkSize is 0).
+def getChunks(count, chunkSize=0):
+    step = chunkSize or count or 1
+    return [(start, min(start + step, count)) for start in range(0, count, step)]
+
+# Returns the index (in edges) of every corner's edge, as an int32 array.
+# An edge is looked up by the unordered pair of its vert indexes (packed into one int64 key), with a binary search of the sorted keys.
+# With chunkSize, the keys of the corners are made chunkSize corners at a time.
+def getCornerEdges(tris, edges, chunkSize=0):
+    tris = numpy.asarray(tris).reshape(-1, 3)
+    edges = numpy.asarray(edges).reshape(-1, 2)
+    vertCount = int(max(tris.max(initial=-1), edges.max(initial=-1))) + 1
+
+    edgeKeys = edges.min(axis=1).astype(numpy.int64) * vertCount + edges.max(axis=1)
+    order = numpy.argsort(edgeKeys, kind="stable")
+    sortedKeys = edgeKeys[order]
+
+    flatTris = tris.reshape(-1)
+    nextTris = tris[:, [1, 2, 0]].reshape(-1)
+    cornerEdges = numpy.empty(len(flatTris), dtype=numpy.int32)
+    for start, end in getChunks(len(flatTris), chunkSize):
+        v0 = flatTris[start:end].astype(numpy.int64)
+        v1 = nextTris[start:end].astype(numpy.int64)
+        keys = numpy.minimum(v0, v1) * vertCount + numpy.maximum(v0, v1)
+
+        found = numpy.searchsorted(sortedKeys, keys).clip(0, max(len(sortedKeys) - 1, 0))
+        if len(keys) and (not len(sortedKeys) or (sortedKeys[found] != keys).any()):
+            raise ValueError("getCornerEdges could not find a matching edge!")
+        cornerEdges[start:end] = order[found]
+
+    return cornerEdges
+
+# Find all tris which have two verts in the same position (no more than epsilon apart).
+# For those tris that do, mark two of their edges as "fake" (LNEVER; the SolidWire shader in Unity will never draw them).
+# Returns a bool mask of the fake edges.
+# With chunkSize, the tris are checked chunkSize corners (chunkSize / 3 tris) at a time.
+def findFakeEdges(co, tris, cornerEdges, edgeCount, epsilon=0.0, chunkSize=0):
+    co = numpy.asarray(co, dtype=numpy.float64)
+    tris = numpy.asarray(tris).reshape(-1, 3)
+    cornerEdges = numpy.asarray(cornerEdges).reshape(-1, 3)
+
+    fakeEdges = numpy.zeros(edgeCount, dtype=bool)
+    for start, end in getChunks(len(tris), chunkSize and max(chunkSize // 3, 1)):
+        for k in range(3):
+
+            # If two verts match, then it's a fake face.
+            offsets = co[tris[start:end, (k + 1) % 3]] - co[tris[start:end, k]]
+            degenerate = numpy.einsum("ij,ij->i", offsets, offsets) <= epsilon * epsilon
+            fakeEdges[cornerEdges[start:end][degenerate, k]] = True
+            fakeEdges[cornerEdges[start:end][degenerate, (k + 1) % 3]] = True
+
+    return fakeEdges
+
+# Returns the type of every edge (based on if it's marked normal/sharp/seam in Blender, or is fake).
+def typeEdges(edgeSharp, edgeSeam, fakeEdges):
+    edgeTypes = numpy.full(len(fakeEdges), LNORMAL, dtype=numpy.int8)
+    edgeTypes[numpy.asarray(edgeSharp, dtype=bool)] = LALWAYS
+    edgeTypes[numpy.asarray(edgeSeam, dtype=bool)] = LHIDE
+    edgeTypes[fakeEdges] = LNEVER
+
+    return edgeTypes
+
+# Changes the LNORMAL edges between two tris of the same material that are (nearly) coplanar to LHIDE.
+# An LNORMAL edge is only drawn when one of its tris faces away from the camera and the other doesn't, which can't happen to
+# coplanar tris, so this saves the shader from testing the edge every frame.
+# - maxAngle: the largest angle (in radians) between the normals of the two tris for the edge to be culled.
+# edgeTypes is updated in place. Returns the number of edges that were culled.
+def cullFlatEdges(co, tris, cornerEdges, edgeTypes, faceMats, maxAngle):
+    co = numpy.asarray(co, dtype=numpy.float64)
+    tris = numpy.asarray(tris).reshape(-1, 3)
+    faceMats = numpy.asarray(faceMats)
+
+    # The two tris of each LNORMAL edge that has exactly two.
+    candidates = (edgeTypes[cornerEdges] == LNORMAL) & (numpy.bincount(cornerEdges, minlength=len(edgeTypes))[cornerEdges] == 2)
+    corners = numpy.nonzero(candidates)[0]
+    pairs = corners[numpy.argsort(cornerEdges[corners], kind="stable")].reshape(-1, 2)
+    tri0, tri1 = pairs[:, 0] // 3, pairs[:, 1] // 3
+
+    # Tris with no area have no normal (so their edges are never culled).
+    normals = numpy.cross(co[tris[:, 1]] - co[tris[:, 0]], co[tris[:, 2]] - co[tris[:, 0]])
+    lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+    numpy.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    cosAngles = numpy.einsum("ij,ij->i", normals[tri0], normals[tri1])
+    flat = (faceMats[tri0] == faceMats[tri1]) & (cosAngles >= numpy.cos(maxAngle)) & (lengths[tri0, 0] > 0) & (lengths[tri1, 0] > 0)
+
+    edgeTypes[cornerEdges[pairs[flat, 0]]] = LHIDE
+    return int(flat.sum())
+
+# Find the 1 or 2 tris that each edge belongs to, and record the lowest material index of them (it will take priority).
+def getEdgeMaterials(edgeCount, cornerEdges, faceMats):
+    edgeMats = numpy.full(edgeCount, numpy.iinfo(numpy.int32).max, dtype=numpy.int32)
+    numpy.minimum.at(edgeMats, cornerEdges, numpy.repeat(numpy.asarray(faceMats, dtype=numpy.int32), 3))
+
+    return edgeMats
+
+# Returns the edge type (UV.y) and edge material of every corner.
+# Rules:
+# - If the edge from v0 to v1 is sharp, then v0 will have the sharp UVs set.
+# - If the edge from v1 to v2 is sharp, then v1 will have the sharp UVs set.
+# - If the edge from v2 to v0 is sharp, then v2 will have the sharp UVs set.
+# - LALWAYS edges with two faces need to have one marked as LNORMAL, and one as LALWAYS (to prevent double rendering).
+#   The first tri of the edge keeps LALWAYS (edgeTable.types is updated in place to LNORMAL when this happens).
+def assignCorners(cornerEdges, edgeTable):
+    cornerTypes = edgeTable.types[cornerEdges]
+    cornerMats = edgeTable.mats[cornerEdges]
+
+    # Only the first corner of each LALWAYS edge keeps LALWAYS.
+    first = numpy.zeros(len(cornerEdges), dtype=bool)
+    first[numpy.unique(cornerEdges, return_index=True)[1]] = True
+    cornerTypes[(cornerTypes == LALWAYS) & ~first] = LNORMAL
+
+    shared = numpy.bincount(cornerEdges, minlength=len(edgeTable.types)) > 1
+    edgeTable.types[shared & (edgeTable.types == LALWAYS)] = LNORMAL
+
+    return cornerTypes, cornerMats
+
+# Returns a key for every (vert, edge type, material) corner. Corners with the same key become the same vert in Unity.
+def getCornerKeys(verts, cornerTypes, cornerMats, matCount):
+    return (verts.astype(numpy.int64) * 4 + (cornerTypes.astype(numpy.int64) - LNEVER)) * matCount + cornerMats
+
+# Returns the sorted unique values of an array.
+def getSortedUnique(values):
+    values = numpy.sort(values)
+    return values[numpy.concatenate([[True], values[1:] != values[:-1]])] if len(values) else values
+
+# Returns the number of unique corner keys (see getCornerKeys()), chunkSize corners at a time.
+def countUniqueCorners(verts, cornerTypes, cornerMats, matCount, chunkSize=0):
+    uniques = [getSortedUnique(getCornerKeys(verts[start:end], cornerTypes[start:end], cornerMats[start:end], matCount))
+               for start, end in getChunks(len(verts), chunkSize)]
+    return len(getSortedUnique(numpy.concatenate(uniques))) if len(uniques) > 1 else sum(len(u) for u in uniques)
+
+# Returns which of the pairs of minimiseCorners() share none of their keys with a pair of a lower priority (so they can all be changed
+# at once, without affecting each other). optionKeys is (pairs, 2, 2) (see minimiseCorners()), and keyCount the number of keys.
+def getIndependentPairs(optionKeys, priorities, keyCount):
+    pairKeys = optionKeys.reshape(-1, 4)
+    owners = numpy.full(keyCount, numpy.iinfo(numpy.int32).max, dtype=numpy.int32)
+    numpy.minimum.at(owners, pairKeys.reshape(-1), numpy.repeat(priorities.astype(numpy.int32), 4))
+    return (owners[pairKeys] == priorities[:, None]).all(axis=1)
+
+# Adds every pair of minimiseCorners() to counts greedily: each in whichever way adds the fewest new unique corners (keeping its
+# choice if both add as many). The pairs are added in rounds of independent pairs (see getIndependentPairs()), by a (fixed) shuffle
+# of the pairs, so that few pairs wait on each other.
+def addPairsGreedily(optionKeys, choices, counts):
+    pending = numpy.arange(len(choices))
+    priorities = numpy.random.default_rng(0).permutation(len(choices)).astype(numpy.int32)
+    while len(pending):
+        ready = getIndependentPairs(optionKeys[pending], priorities[pending], len(counts))
+        pairIdxs = pending[ready]
+        costs = (counts[optionKeys[pairIdxs]] == 0).sum(axis=2)
+        choices[pairIdxs] = numpy.where(costs[:, 0] == costs[:, 1], choices[pairIdxs], costs[:, 1] < costs[:, 0])
+        counts += numpy.bincount(optionKeys[pairIdxs, choices[pairIdxs]].reshape(-1), minlength=len(counts)).astype(numpy.int32)
+        pending = pending[~ready]
+
+# Swaps the pairs of minimiseCorners() (which of their tris keeps LALWAYS) while that removes unique corners.
+# Each round, every pair whose swap would remove unique corners is a candidate, and the candidates that share no key with a better
+# candidate are swapped (see getIndependentPairs()). So every round removes unique corners, until no swap helps (or MAX_MINIMISE_ROUNDS).
+# Only the pairs with a key whose count changed need their gains updating, chunkSize pairs at a time.
+def swapPairs(optionKeys, choices, counts, chunkSize=0):
+    gains = numpy.zeros(len(choices), dtype=numpy.int8)
+    updates = numpy.arange(len(choices))
+    for _ in range(MAX_MINIMISE_ROUNDS):
+        # The unique corners each pair would remove by swapping: the keys only it uses now, less the unused keys it would use instead
+        # (the two options only share keys if both corners have the same vert and material, and then each has the other's keys swapped).
+        for start, end in getChunks(len(updates), chunkSize):
+            pairIdxs = updates[start:end]
+            current = optionKeys[pairIdxs, choices[pairIdxs]]
+            other = optionKeys[pairIdxs, 1 - choices[pairIdxs]]
+            removed = counts[current] <= 1
+            added = counts[other] <= (other == current[:, ::-1])
+            gains[pairIdxs] = removed[:, 0].astype(numpy.int8) + removed[:, 1] - added[:, 0] - added[:, 1]
+
+        # The best candidates (the highest gain, then the lowest index) have the lowest priority.
+        candidates = numpy.nonzero(gains > 0)[0]
+        if not len(candidates):
+            break
+        candidates = candidates[numpy.argsort(-gains[candidates], kind="stable")]
+        swaps = candidates[getIndependentPairs(optionKeys[candidates], numpy.arange(len(candidates), dtype=numpy.int32), len(counts))]
+        del candidates
+
+        counts -= numpy.bincount(optionKeys[swaps, choices[swaps]].reshape(-1), minlength=len(counts)).astype(numpy.int32)
+        choices[swaps] = 1 - choices[swaps]
+        counts += numpy.bincount(optionKeys[swaps, choices[swaps]].reshape(-1), minlength=len(counts)).astype(numpy.int32)
+
+        changed = numpy.zeros(len(counts), dtype=bool)
+        changed[optionKeys[swaps].reshape(-1)] = True
+        updates = numpy.nonzero(changed[optionKeys.reshape(-1, 4)].any(axis=1))[0]
+        del changed
+
+# Changes the corners (within the shader's rules) so that as many of them as possible can share a vert in Unity.
+# - LHIDE corners are never drawn, so their material doesn't matter: every LHIDE corner of a vert is given the same one.
+# - Of the two tris of a (manifold) LALWAYS edge (a "pair" of corners), either can be the one that keeps LALWAYS (the other is LNORMAL;
+#   see assignCorners()), so the tris are chosen that leave the fewest unique corners. Both the tris assignCorners() chose and a greedy
+#   choice (see addPairsGreedily()) are refined by swapping tris (see swapPairs()), and whichever leaves fewer unique corners is kept
+#   (neither is always better). Both work on many pairs at once (rather than one pair at a time, in Python).
+# - verts: (corners,) the vert index of every corner.
+# - alwaysEdges: (edges,) whether each edge was LALWAYS (before assignCorners() de-duplicated them).
+# - chunkSize: the corners are keyed (and the swaps evaluated) this many at a time.
+# Returns the new corner types and materials, and the number of unique corners before and after.
+def minimiseCorners(verts, cornerEdges, cornerTypes, cornerMats, alwaysEdges, chunkSize=0):
+    verts = numpy.asarray(verts)
+    cornerTypes = numpy.array(cornerTypes, dtype=numpy.int8)
+    cornerMats = numpy.array(cornerMats, dtype=numpy.int32)
+    matCount = int(cornerMats.max()) + 1
+    before = countUniqueCorners(verts, cornerTypes, cornerMats, matCount, chunkSize)
+
+    # Give the LHIDE corners the lowest material of their vert.
+    vertMats = numpy.full(int(verts.max()) + 1, numpy.iinfo(numpy.int32).max, dtype=numpy.int32)
+    numpy.minimum.at(vertMats, verts, cornerMats)
+    hidden = cornerTypes == LHIDE
+    cornerMats[hidden] = vertMats[verts[hidden]]
+    del vertMats, hidden
+
+    # The two corners of each LALWAYS edge with exactly two tris (both of its corners have the edge's material).
+    swappable = numpy.asarray(alwaysEdges, dtype=bool)[cornerEdges] & (numpy.bincount(cornerEdges)[cornerEdges] == 2)
+    pairCorners = numpy.nonzero(swappable)[0]
+    pairs = pairCorners[numpy.argsort(cornerEdges[pairCorners], kind="stable")].reshape(-1, 2)
+    del pairCorners
+
+    if len(pairs):
+        # A pair corner's key (see getCornerKeys()) only depends on its vert and material, and on whether it's the LALWAYS corner,
+        # so each (vert, material) of the pairs' corners is given an index j, and keys j * 2 and j * 2 + 1 are its LNORMAL and LALWAYS keys.
+        # optionKeys[i, o] are then the keys of pair i's two corners if its corner o keeps LALWAYS.
+        keyType = numpy.int32 if (int(verts.max()) + 1) * matCount <= numpy.iinfo(numpy.int32).max else numpy.int64
+        vertMats, pairVertMats = numpy.unique(verts[pairs].astype(keyType) * matCount + cornerMats[pairs], return_inverse=True)
+        pairVertMats = pairVertMats.reshape(-1, 2).astype(numpy.int32) * 2
+        optionKeys = numpy.stack([pairVertMats + [1, 0], pairVertMats + [0, 1]], axis=1)
+        del pairVertMats
+
+        # The number of corners that use each key: the corners that can't change (if any of them use it), plus each pair's chosen corners.
+        fixedCounts = numpy.zeros(len(vertMats) * 2, dtype=numpy.int32)
+        for start, end in getChunks(len(verts), chunkSize):
+            types = cornerTypes[start:end]
+            fixed = ~swappable[start:end] & ((types == LALWAYS) | (types == LNORMAL))
+            keys = verts[start:end][fixed].astype(keyType) * matCount + cornerMats[start:end][fixed]
+            found = numpy.minimum(numpy.searchsorted(vertMats, keys), len(vertMats) - 1)
+            matched = vertMats[found] == keys
+            fixedCounts[found[matched] * 2 + (types[fixed][matched] == LALWAYS)] = 1
+        del vertMats
+
+        rows = numpy.arange(len(pairs))
+        assigned = (cornerTypes[pairs[:, 1]] == LALWAYS).astype(numpy.int8)
+        counts = fixedCounts + numpy.bincount(optionKeys[rows, assigned].reshape(-1), minlength=len(fixedCounts)).astype(numpy.int32)
+        swapPairs(optionKeys, assigned, counts, chunkSize)
+
+        greedy = assigned.copy()
+        greedyCounts = fixedCounts
+        addPairsGreedily(optionKeys, greedy, greedyCounts)
+        swapPairs(optionKeys, greedy, greedyCounts, chunkSize)
+        choices = greedy if numpy.count_nonzero(greedyCounts) < numpy.count_nonzero(counts) else assigned
+
+        cornerTypes[pairs.reshape(-1)] = LNORMAL
+        cornerTypes[pairs[rows, choices]] = LALWAYS
+
+    after = countUniqueCorners(verts, cornerTypes, cornerMats, matCount, chunkSize)
+    return cornerTypes, cornerMats, (before, after)
+
+# Returns each tri's 3 adjacent tri indexes (or -1 if there's no adjacent tri on an edge), as an int32 array.
+# Adjacency k of a tri is the tri on the other side of its edge k (the first other tri of the edge, if it has more than two).
+# With chunkSize, the adjacencies are looked up chunkSize corners at a time.
+def getTriAdjacency(cornerEdges, chunkSize=0):
+    cornerEdges = numpy.asarray(cornerEdges)
+    order = numpy.argsort(cornerEdges, kind="stable").astype(numpy.int32)
+    sortedEdges = cornerEdges[order]
+
+    # The first tri of each edge, and the first tri after that which isn't the same tri (or -1 if there isn't one).
+    starts = numpy.ones(len(order), dtype=bool)
+    starts[1:] = sortedEdges[1:] != sortedEdges[:-1]
+    del sortedEdges
+    group = numpy.cumsum(starts, dtype=numpy.int32) - 1
+    sortedTris = order // 3
+    firstTris = sortedTris[starts]
+    del starts
+
+    others = numpy.nonzero(sortedTris != firstTris[group])[0]
+    otherTris = numpy.full(len(firstTris), -1, dtype=numpy.int32)
+    otherGroups, firstOthers = numpy.unique(group[others], return_index=True)
+    otherTris[otherGroups] = sortedTris[others[firstOthers]]
+    del others, sortedTris
+
+    # Each corner's adjacent tri is the first tri of its edge, unless it is that tri.
+    triAdjs = numpy.empty(len(order), dtype=numpy.int32)
+    for start, end in getChunks(len(order), chunkSize):
+        corners = order[start:end]
+        firsts = firstTris[group[start:end]]
+        triAdjs[corners] = numpy.where(corners // 3 != firsts, firsts, otherTris[group[start:end]])
+
+    return triAdjs
+
+# Splits the mesh indexes stored in UV.x for the packed index layout (see PACK_BASE).
+# Returns the new UV0s (with only the lowest digit left in x) and the UV1s (the two higher digits).
+def packIndexes(uvs):
+    indexes = uvs[:, 0].astype(numpy.int64)
+    uv0 = uvs.copy()
+    uv0[:, 0] = indexes % PACK_BASE
+    uv1 = numpy.stack([(indexes // PACK_BASE) % PACK_BASE, indexes // (PACK_BASE * PACK_BASE)], axis=1).astype(numpy.float32)
+    return uv0, uv1
+
+# Returns the material colors as a (materials, 4) array. If there are none, it's a single white color.
+def getPalette(matColors):
+    palette = numpy.asarray(matColors, dtype=numpy.float32).reshape(-1, 4)
+    return palette if len(palette) else numpy.ones((1, 4), dtype=numpy.float32)
+
+# Returns the edge buffer: one EDGE_RECORD per edge, so a shader can draw every edge once (rather than once from each of its tris).
+# - edgeTypes: the type of every edge (before assignCorners() de-duplicated the LALWAYS edges).
+def getEdgeRecords(edgeTable, edgeTypes, cornerEdges, matColors):
+    records = numpy.zeros(len(edgeTypes), dtype=EDGE_RECORD)
+    records["v0"] = edgeTable.verts[:, 0]
+    records["v1"] = edgeTable.verts[:, 1]
+    records["type"] = edgeTypes
+
+    # The tris of the first two corners of each edge.
+    order = numpy.argsort(cornerEdges, kind="stable")
+    edges, firsts, counts = numpy.unique(numpy.asarray(cornerEdges)[order], return_index=True, return_counts=True)
+    records["tri0"] = -1
+    records["tri1"] = -1
+    records["tri0"][edges] = order[firsts] // 3
+    records["tri1"][edges[counts > 1]] = order[firsts[counts > 1] + 1] // 3
+
+    # Edges without tris have no material (their color is never used).
+    palette = getPalette(matColors)
+    records["color"] = palette[numpy.where(edgeTable.mats < len(palette), edgeTable.mats, 0)]
+    return records
+
+# Returns the UVs and vertex colors of every corner (see EncodedMesh), and the number of unique corners before and after
+# minimiseCorners() (or None if minimiseVerts isn't set).
+# With chunkSize, the UVs and vertex colors are written chunkSize corners at a time (so no other full size arrays are made).
+def encodeCorners(tris, cornerEdges, edgeTable, matColors, minimiseVerts=False, chunkSize=0):
+    alwaysEdges = edgeTable.types == LALWAYS
+    cornerTypes, cornerMats = assignCorners(cornerEdges, edgeTable)
+
+    flatTris = numpy.asarray(tris).reshape(-1)
+    vertCounts = None
+    if minimiseVerts and len(cornerEdges):
+        cornerTypes, cornerMats, vertCounts = minimiseCorners(flatTris, cornerEdges, cornerTypes, cornerMats, alwaysEdges, chunkSize)
+
+    # If multiple materials are used, then the mesh will be rendered with multiple submeshes.
+    # Unfortunately, the Unity SolidWire shader breaks if multiple submeshes are used at this time, so instead we'll convert the materials to
+    # vertex colors instead (the lowest mat color of each edge is assigned to its vert0).
+    palette = getPalette(matColors)
+    if len(matColors) == 0:
+        cornerMats = numpy.zeros(len(cornerEdges), dtype=numpy.int32)
+
+    # UV.x is the vert's mesh index, UV.y is the edge type.
+    cornerCount = len(cornerEdges)
+    uvs = numpy.empty((cornerCount, 2), dtype=numpy.float32)
+    colors = numpy.empty((cornerCount, 4), dtype=numpy.float32)
+    for start, end in getChunks(cornerCount, chunkSize):
+        uvs[start:end, 0] = flatTris[start:end]
+        uvs[start:end, 1] = cornerTypes[start:end]
+        numpy.take(palette, cornerMats[start:end], axis=0, out=colors[start:end])
+
+    return uvs, colors, vertCounts
+
+# Encodes a triangulated mesh for the SolidWire shader.
+# - co: (verts, 3) vert positions.
+# - tris: (tris, 3) vert indexes of each tri.
+# - edges: (edges, 2) vert indexes of each edge.
+# - edgeSharp, edgeSeam: (edges,) whether each edge is marked as sharp/seam.
+# - faceMats: (tris,) material index of each tri.
+# - matColors: (materials, 4) color of each material. If there are none, every corner will be white.
+# - fakeEpsilon: tris with two verts no more than this far apart are fake (see findFakeEdges()).
+# - cullAngle: LNORMAL edges between tris (of the same material) whose normals are no more than this many radians apart are never drawn
+#   (see cullFlatEdges()). None doesn't cull any edges.
+# - minimiseVerts: change the corners (within the shader's rules) so fewer verts are needed (see minimiseCorners()).
+# - buildEdges: also make the edge buffer (see getEdgeRecords()).
+# - chunkSize: process the corners this many at a time, so the peak memory stays close to the size of the output arrays (0 is all at once).
+# - timer: times each stage of the encoding (see timing.StageTimer).
+# Returns an EncodedMesh.
+def encode(co, tris, edges, edgeSharp, edgeSeam, faceMats, matColors, fakeEpsilon=0.0, cullAngle=None, minimiseVerts=False, buildEdges=False, chunkSize=0, timer=NULL_TIMER):
+    co = numpy.asarray(co).reshape(-1, 3)
+    tris = numpy.asarray(tris, dtype=numpy.int32).reshape(-1, 3)
+    edges = numpy.asarray(edges, dtype=numpy.int32).reshape(-1, 2)
+
+    with timer.stage("cornerEdges"):
+        cornerEdges = getCornerEdges(tris, edges, chunkSize)
+
+    with timer.stage("fakeEdges"):
+        fakeEdges = findFakeEdges(co, tris, cornerEdges, len(edges), fakeEpsilon, chunkSize)
+
+    with timer.stage("edgeTypes"):
+        edgeTable = EdgeTable(edges, typeEdges(edgeSharp, edgeSeam, fakeEdges), getEdgeMaterials(len(edges), cornerEdges, faceMats), fakeEdges)
+
+    culledEdges = 0
+    if cullAngle is not None:
+        with timer.stage("cullEdges"):
+            culledEdges = cullFlatEdges(co, tris, cornerEdges, edgeTable.types, faceMats, cullAngle)
+
+    edgeTypes = edgeTable.types.copy() # (Before the LALWAYS edges are de-duplicated).
+
+    with timer.stage("encode"):
+        uvs, colors, vertCounts = encodeCorners(tris, cornerEdges, edgeTable, matColors, minimiseVerts, chunkSize)
+
+    with timer.stage("adjacency"):
+        triAdjs = getTriAdjacency(cornerEdges, chunkSize)
+
+    edgeRecords = None
+    if buildEdges:
+        with timer.stage("edgeBuffer"):
+            edgeRecords = getEdgeRecords(edgeTable, edgeTypes, cornerEdges, matColors)
+
+    return EncodedMesh(uvs, colors, edgeTable.types, edgeTable.fake, triAdjs, vertCounts, culledEdges, edgeRecords)
@@ -0,0 +1,1286 @@
+from io import StringIO
+import numpy
+import bpy
+import bmesh
+import cProfile
+import datetime
+import hashlib
+import json
+import math
+import os
+import pstats
+import struct
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from bpy.types import Operator
+from bpy.props import (BoolProperty, FloatProperty, IntProperty, StringProperty, EnumProperty)
+from bpy_extras.io_utils import ExportHelper, axis_conversion
+
+from . import encoding, parallel, reorder
+from .cache import ExportCache, DEFAULT_CACHE_DIR, CACHE_VERSION
+from .sidecar import SIDECAR_EXT, packAdjacency, packEdges, packLayout, packOrder, writeSidecar
+from .swmesh import SWMESH_EXT, packObject, writeSwmesh
+from .timing import StageTimer, NULL_TIMER
+
+'''
+    Description:
+    ============
+    The SolidWire FBX export operator (see __init__.py for what the export does).
+    This is the Blender side of the export: it gets the evaluated mesh of each object, triangulates it and converts its loose edges,
+    then passes the mesh's arrays to encoding.encode() and writes the UVs and vertex colors it returns back to the mesh.
+'''
+
+HIDE_FBX_LOGS = False
+
+WHITE = (1.0, 1.0, 1.0, 1.0)
+
+# LODs (see getDecimatedMesh() and createLodObjects()).
+LOD_LOCK_GROUP = "SolidWireLODLock"     # Vertex group of the verts decimation mustn't move.
+LOD_LOCK_FACTOR = 1000.0                # Strength of the lock group (the most the Decimate modifier allows).
+LOD_SOURCE_SUFFIX = ".SolidWireSource"  # Added to the name of an object while its LOD chain is exported under its name.
+
+# Name of the UV map the higher digits of the packed mesh indexes are stored in (see encoding.PACK_BASE).
+INDEX_UV_NAME = "SolidWireIndex"
+
+# Number of corners encoded at once with the low_memory option (see encoding.encode()).
+LOW_MEMORY_CHUNK_SIZE = 1 << 16
+
+# The profile report is written next to the .fbx, with this extension.
+PROFILE_EXT = ".swprofile.json"
+PROFILE_LINES = 40 # Number of functions included in the cProfile of the slowest object.
+
+# Operator options that don't affect the encoding of a mesh (so they aren't part of the cache key).
+# The batching and LOD options are left out as the merged mesh and each LOD level are hashed (and cached) after they're made.
+NON_CACHE_OPTIONS = ('filter_glob', 'output_format', 'batch_static', 'batch_name', 'lod_count', 'lod_ratio', 'use_cache', 'cache_dir', 'cache_size', 'use_profiling', 'profile_slowest', 'encode_processes', 'low_memory', 'share_instances')
+
+# The following modifiers will NOT be applied prior to the SolidWire calculations.
+# All other modifiers will be applied prior; as SolidWire needs very specific, custom UVs to be applied to every vertex the final mesh will use.
+MODIFIERS_TO_IGNORE = [
+    "ARMATURE"
+]
+
+# Globals
+# -------------------------------------------------------------------------------
+# Returns the key of the SolidWire mesh of obj: objects with the same key end up with the same SolidWire mesh, so they can share it.
+# Only objects with no modifiers (other than the MODIFIERS_TO_IGNORE) can share their mesh data's SolidWire mesh,
+# and only with the objects that have the same material colors (as they're encoded into the mesh). Returns None if obj can't share it.
+def getInstanceKey(obj):
+    if any(m.type not in MODIFIERS_TO_IGNORE for m in obj.modifiers):
+        return None
+    return (obj.data.as_pointer(), tuple(map(tuple, getMaterialColors(obj))))
+
+# Returns a new (temporary) mesh for each of the objs, with all of their modifiers applied except for the MODIFIERS_TO_IGNORE.
+# Modifiers that have been disabled in the properties window aren't applied either.
+# With shareInstances, the objects with the same instance key (see getInstanceKey()) are given the same mesh.
+def getEvaluatedMeshes(context, objs, shareInstances=False):
+
+    # Temporarily disable the ignored modifiers so the depsgraph evaluates the meshes without them.
+    ignoredModifiers = [m for o in objs for m in o.modifiers if m.type in MODIFIERS_TO_IGNORE and m.show_viewport]
+    for m in ignoredModifiers:
+        m.show_viewport = False
+
+    try:
+        depsgraph = context.evaluated_depsgraph_get()
+        instances = {}
+        meshes = []
+        for o in objs:
+            key = getInstanceKey(o) if shareInstances else None
+            if key is None or key not in instances:
+                mesh = bpy.data.meshes.new_from_object(o.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+                instances.setdefault(key, mesh)
+            meshes.append(instances[key] if key is not None else mesh)
+        return meshes
+    finally:
+        for m in ignoredModifiers:
+            m.show_viewport = True
+
+# Source: https://blender.stackexchange.com/questions/45698/triangulate-mesh-in-python
+def triangulateObject(bm):
+    #bmesh.ops.triangulate(bm, faces=bm.faces[:], quad_method=0, ngon_method=0)
+    bmesh.ops.triangulate(bm, faces=bm.faces[:])
+
+# Converts all loose edges to triangles, with the new (third) vert being in the same location as vert[0].
+# Returns the number of loose edges that were converted.
+def convertLooseEdges(bm):
+
+    # Find all edges that aren't part of faces (either of their verts isn't linked to a face).
+    looseVerts = {v for v in bm.verts if not v.link_faces}
+    looseEdges = [e for e in bm.edges if e.verts[0] in looseVerts or e.verts[1] in looseVerts]
+
+    # Create the third vert for each loose edge.
+    # Using vert[0] as the example copies all of its data, so its armature weights (if there are any) are duplicated to the new vert as well.
+    newVerts = [bm.verts.new(e.verts[0].co, e.verts[0]) for e in looseEdges]
+
+    # Connect each loose edge to its new vert to create a new tri.
+    for e, v2 in zip(looseEdges, newVerts):
+
+        # Mark the loose edge as a sharp edge (it should always be drawn by the SolidWire shader).
+        e.smooth = False
+        bm.faces.new((e.verts[0], e.verts[1], v2))
+
+    # Applies the newly created data (refreshes the indexes).
+    bm.verts.index_update()
+    bm.edges.index_update()
+    bm.faces.index_update()
+
+    return len(looseEdges)
+
+# Reorders the tris and verts of the (triangulated) bmesh for the GPU's vertex cache (see reorder.py).
+# The encoding (and UV.x) is worked out afterwards from the reordered mesh, so SolidWire.Postprocess() still finds the right mesh indexes.
+# Returns the ACMR of the tris before and after reordering.
+def reorderMesh(bm):
+    tris = [[v.index for v in f.verts] for f in bm.faces]
+    triRanks, vertRanks, acmrBefore, acmrAfter = reorder.reorder(tris, len(bm.verts))
+
+    bm.faces.sort(key=lambda f: triRanks[f.index])
+    bm.verts.sort(key=lambda v: vertRanks[v.index])
+    bm.verts.index_update()
+    bm.faces.index_update()
+
+    return acmrBefore, acmrAfter
+
+# Returns the verts that decimation mustn't move: those of sharp (LALWAYS) and seam (LHIDE) edges, and of loose edges.
+def getLockedVerts(mesh):
+    edgeCount = len(mesh.edges)
+    edgeVerts = numpy.empty(edgeCount * 2, dtype=numpy.int32)
+    mesh.edges.foreach_get("vertices", edgeVerts)
+
+    locked = numpy.zeros(edgeCount, dtype=bool)
+    for attr in ("use_edge_sharp", "use_seam", "is_loose"):
+        values = numpy.empty(edgeCount, dtype=bool)
+        mesh.edges.foreach_get(attr, values)
+        locked |= values
+
+    return numpy.unique(edgeVerts.reshape(-1, 2)[locked]).tolist()
+
+# Returns a new (temporary) copy of the evaluated mesh of obj, decimated to ratio of its faces with a Decimate modifier.
+# The locked verts (see getLockedVerts()) are weighted so the decimation leaves them (and so their edges) alone,
+# and the weights are removed from the decimated mesh afterwards, so only the object's own vertex groups are exported.
+def getDecimatedMesh(context, obj, mesh, ratio):
+    lodMesh = mesh.copy()
+    tempObj = bpy.data.objects.new("SolidWireDecimate", lodMesh)
+    context.scene.collection.objects.link(tempObj)
+
+    try:
+        # The mesh's vertex group weights refer to the groups by index, so the object's groups are copied (in order) before the lock group.
+        for group in obj.vertex_groups:
+            tempObj.vertex_groups.new(name=group.name)
+        lockGroup = tempObj.vertex_groups.new(name=LOD_LOCK_GROUP)
+        lockGroup.add(getLockedVerts(lodMesh), 1.0, 'REPLACE')
+
+        decimate = tempObj.modifiers.new("SolidWireDecimate", 'DECIMATE')
+        decimate.decimate_type = 'COLLAPSE'
+        decimate.ratio = ratio
+        decimate.use_collapse_triangulate = True
+        decimate.vertex_group = LOD_LOCK_GROUP
+        decimate.invert_vertex_group = True
+        decimate.vertex_group_factor = LOD_LOCK_FACTOR
+
+        depsgraph = context.evaluated_depsgraph_get()
+        depsgraph.update()
+        decimated = bpy.data.meshes.new_from_object(tempObj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+    finally:
+        bpy.data.objects.remove(tempObj)
+        bpy.data.meshes.remove(lodMesh)
+
+    # The mesh has no way to remove a group's weights, but removing the group from an object that uses the mesh does.
+    # The lock group is the last one, so removing it doesn't change the indexes of the object's own groups.
+    try:
+        weightsObj = bpy.data.objects.new("SolidWireWeights", decimated)
+        try:
+            for group in obj.vertex_groups:
+                weightsObj.vertex_groups.new(name=group.name)
+            weightsObj.vertex_groups.remove(weightsObj.vertex_groups.new(name=LOD_LOCK_GROUP))
+        finally:
+            bpy.data.objects.remove(weightsObj)
+    except Exception:
+        bpy.data.meshes.remove(decimated)
+        raise
+
+    return decimated
+
+# Creates the (temporary) objects a LOD chain is exported as: an empty in the place of obj, with a child for each LOD mesh
+# (named "<obj name>_LOD<level>", so that Unity adds a LODGroup to the empty when it imports the .fbx).
+# The empty takes obj's name (name, which the caller keeps to give it back), so obj is renamed until restoreLodNames() is called.
+# Returns the empty, and the LOD objects.
+def createLodObjects(context, obj, name, lodMeshes):
+    obj.name = name + LOD_SOURCE_SUFFIX
+
+    empty = bpy.data.objects.new(name, None)
+    context.scene.collection.objects.link(empty)
+    empty.parent = obj.parent
+    empty.matrix_world = obj.matrix_world
+
+    lodObjs = []
+    for level, lodMesh in enumerate(lodMeshes):
+        lodObj = bpy.data.objects.new("%s_LOD%i" % (name, level), lodMesh)
+        context.scene.collection.objects.link(lodObj)
+        lodObj.parent = empty
+
+        # Keep the object's vertex groups and the modifiers that aren't applied (such as its armature).
+        for group in obj.vertex_groups:
+            lodObj.vertex_groups.new(name=group.name)
+        for modifier in obj.modifiers:
+            if modifier.type in MODIFIERS_TO_IGNORE:
+                lodModifier = lodObj.modifiers.new(modifier.name, modifier.type)
+                lodModifier.object = modifier.object
+
+        lodObjs.append(lodObj)
+
+    return empty, lodObjs
+
+# Returns whether the object can be merged with the other static objects: it isn't deformed by an armature (or animated).
+def isStatic(obj):
+    if obj.animation_data and obj.animation_data.action:
+        return False
+    if obj.parent and obj.parent.type == 'ARMATURE':
+        return False
+    return not any(m.type in MODIFIERS_TO_IGNORE for m in obj.modifiers)
+
+# Merges the (temporary, evaluated) meshes of the objects into a single new mesh, in world space.
+# The material colors of all of the objects are merged into a single palette (which the merged mesh's material indexes refer to),
+# so they're still converted to the right vertex colors. The merged mesh has no vertex group weights.
+# Returns the merged mesh, and its palette.
+def mergeMeshes(name, objs, meshes, matColorsList):
+    palette = []
+    paletteIdxs = {}
+    def getPaletteIdx(color):
+        if color not in paletteIdxs:
+            paletteIdxs[color] = len(palette)
+            palette.append(color)
+        return paletteIdxs[color]
+
+    bm = bmesh.new()
+    for obj, mesh, matColors in zip(objs, meshes, matColorsList):
+
+        # Objects without materials are white (see encoding.encode()).
+        remap = numpy.array([getPaletteIdx(tuple(c)) for c in matColors] or [getPaletteIdx(WHITE)], dtype=numpy.int32)
+        faceMats = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+        mesh.polygons.foreach_get("material_index", faceMats)
+        mesh.polygons.foreach_set("material_index", remap[numpy.minimum(faceMats, len(remap) - 1)])
+
+        # Each mesh's vert indexes are offset by the verts before it as it's appended (so UV.x will be its index in the merged mesh).
+        mesh.transform(obj.matrix_world)
+        bm.from_mesh(mesh)
+
+    # The vertex group weights refer to each object's own groups by index, so they'd be mixed up between the objects,
+    # and static objects have no armature for them to deform the mesh with anyway (see isStatic()), so they're dropped.
+    deform = bm.verts.layers.deform.active
+    if deform:
+        bm.verts.layers.deform.remove(deform)
+
+    merged = bpy.data.meshes.new(name)
+    bm.to_mesh(merged)
+    bm.free()
+
+    return merged, palette
+
+# Gives each object renamed by createLodObjects() its original name back (once the empty that took its name has been removed).
+# renamed is a list of (object, original name) pairs: the name can't be worked out from the new one,
+# which Blender may have cut short (names are at most 63 bytes) or made unique (with a ".001" suffix).
+def restoreLodNames(renamed):
+    for obj, name in renamed:
+        obj.name = name
+
+# Returns the diffuse color of each of the object's material slots (white for empty slots).
+def getMaterialColors(obj):
+    return [tuple(s.material.diffuse_color) if s.material else WHITE for s in obj.material_slots]
+
+# Returns the arrays encoding.encode() needs from a triangulated mesh.
+# Every polygon is a tri at this point, so the loops of tri f are 3f, 3f+1 and 3f+2.
+def readMesh(mesh):
+    def get(collection, attr, count, dtype):
+        values = numpy.empty(count, dtype=dtype)
+        collection.foreach_get(attr, values)
+        return values
+
+    return {
+        "co": get(mesh.vertices, "co", len(mesh.vertices) * 3, numpy.float32),
+        "tris": get(mesh.loops, "vertex_index", len(mesh.loops), numpy.int32),
+        "edges": get(mesh.edges, "vertices", len(mesh.edges) * 2, numpy.int32),
+        "edgeSharp": get(mesh.edges, "use_edge_sharp", len(mesh.edges), bool),
+        "edgeSeam": get(mesh.edges, "use_seam", len(mesh.edges), bool),
+        "faceMats": get(mesh.polygons, "material_index", len(mesh.polygons), numpy.int32),
+    }
+
+# Stores an encoding.EncodedMesh in the mesh's UVs and vertex colors.
+# With packIndexes, the mesh indexes are split across the first two UV maps (see encoding.PACK_BASE).
+def writeEncodedMesh(mesh, encoded, packIndexes=False):
+    uvs = encoded.uvs
+
+    # Ensure the mesh has a UV map (every UV in it is overwritten below).
+    if not mesh.uv_layers:
+        mesh.uv_layers.new()
+
+    if packIndexes:
+        uvs, uv1s = encoding.packIndexes(uvs)
+        setIndexUvs(mesh, uv1s)
+
+    # Materials are converted to vertex colors. Ensure the mesh has data for vertex colors.
+    if not mesh.vertex_colors:
+        mesh.vertex_colors.new()
+
+    mesh.uv_layers.active.data.foreach_set("uv", uvs.ravel())
+    mesh.vertex_colors.active.data.foreach_set("color", encoded.colors.ravel())
+
+    # The edge types are stored in the UVs now, so the edges don't need to be marked as sharp anymore.
+    mesh.edges.foreach_set("use_edge_sharp", numpy.zeros(len(mesh.edges), dtype=bool))
+
+# Stores the higher digits of the packed mesh indexes in a second UV map (Unity's UV1), right after the active one.
+# Any other UV maps are removed, so nothing else can end up in UV1.
+def setIndexUvs(mesh, uv1s):
+    for name in [l.name for l in mesh.uv_layers if not l.active]:
+        mesh.uv_layers.remove(mesh.uv_layers[name])
+
+    mesh.uv_layers.new(name=INDEX_UV_NAME)
+    mesh.uv_layers.active_index = 0
+    mesh.uv_layers[INDEX_UV_NAME].data.foreach_set("uv", uv1s.ravel())
+
+# The first half of buildSolidWireMesh() (which needs bpy): triangulates the (temporary) mesh of an object and converts its loose edges.
+# Returns the arrays encoding.encode() needs (see readMesh()).
+def prepareSolidWireMesh(mesh, optimizeOrder=False, timer=NULL_TIMER, stats=None):
+
+    # Ensure smooth shading is used for the mesh (this is used by the Unity shader to contract the normals).
+    mesh.polygons.foreach_set("use_smooth", numpy.ones(len(mesh.polygons), dtype=bool))
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+
+    # Triangulate the mesh. Every triangle in the final mesh needs to be processed for SolidWire.
+    with timer.stage("triangulate"):
+        triangulateObject(bm)
+
+    with timer.stage("looseEdges"):
+        looseEdgeCount = convertLooseEdges(bm)
+
+    acmr = None
+    if optimizeOrder:
+        with timer.stage("reorder"):
+            acmr = reorderMesh(bm)
+
+    bm.to_mesh(mesh)
+    bm.free()
+
+    with timer.stage("readMesh"):
+        arrays = readMesh(mesh)
+
+    if stats is not None:
+        stats["looseEdges"] = looseEdgeCount
+        if acmr:
+            stats["acmrBefore"], stats["acmrAfter"] = acmr
+
+    return arrays
+
+# The second half of buildSolidWireMesh(): writes the EncodedMesh of the arrays prepareSolidWireMesh() returned back to the mesh.
+# Returns the mesh's tri vert indexes and tri adjacencies (see encoding.getTriAdjacency()).
+def finishSolidWireMesh(mesh, arrays, encoded, packIndexes=False, timer=NULL_TIMER, stats=None):
+    with timer.stage("writeMesh"):
+        writeEncodedMesh(mesh, encoded, packIndexes)
+
+    # Remove all materials from the mesh before exporting (ensuring only one submesh is used).
+    mesh.materials.clear()
+
+    if stats is not None:
+        stats["fakeEdges"] = int(encoded.fakeEdges.sum())
+        stats["culledEdges"] = encoded.culledEdges
+        stats["edgeTypes"] = {name: int((encoded.edgeTypes == t).sum()) for t, name in encoding.EDGE_TYPE_NAMES.items()}
+        if encoded.vertCounts:
+            stats["unityVertsBefore"], stats["unityVertsAfter"] = encoded.vertCounts
+
+    return arrays["tris"], encoded.triAdjs
+
+# Runs all of the SolidWire processing on the (temporary) mesh of an object.
+# Returns the mesh's tri vert indexes and tri adjacencies (see encoding.getTriAdjacency()).
+# timer times each stage of the processing (see timing.StageTimer).
+# If optimizeOrder is set, the tris and verts are reordered for the GPU's vertex cache (see reorderMesh()).
+# If minimiseVerts is set, the corners are encoded so that as few verts as possible are needed in Unity (see encoding.minimiseCorners()).
+# If cullAngle is given, the smooth edges between (nearly) coplanar tris are never drawn (see encoding.cullFlatEdges()).
+# If buildEdges is set, the edge buffer is built too (see encoding.buildEdgeRecords()), and chunkSize bounds the memory used (see encoding.encode()).
+# If a stats dict is given, the number of loose edges, fake edges, culled edges and edges of each type (and the ACMR, if reordered,
+# and the Unity vert count before and after, if minimised) are added to it.
+def buildSolidWireMesh(mesh, matColors, fakeEpsilon=0.0, packIndexes=False, optimizeOrder=False, minimiseVerts=False, cullAngle=None,
+                       buildEdges=False, chunkSize=0, timer=NULL_TIMER, stats=None):
+    arrays = prepareSolidWireMesh(mesh, optimizeOrder, timer, stats)
+    encoded = encoding.encode(matColors=matColors, fakeEpsilon=fakeEpsilon, cullAngle=cullAngle, minimiseVerts=minimiseVerts,
+                              buildEdges=buildEdges, chunkSize=chunkSize, timer=timer, **arrays)
+    return finishSolidWireMesh(mesh, arrays, encoded, packIndexes, timer, stats)
+
+# Returns the vertex group weights of the mesh as 3 arrays: vert indexes, group indexes and weights.
+def getVertexWeights(mesh):
+    verts = []
+    groups = []
+    weights = []
+    for v in mesh.vertices:
+        for g in v.groups:
+            verts.append(v.index)
+            groups.append(g.group)
+            weights.append(g.weight)
+
+    return (
+        numpy.array(verts, dtype=numpy.int32),
+        numpy.array(groups, dtype=numpy.int32),
+        numpy.array(weights, dtype=numpy.float32)
+    )
+
+# Sets the vertex group weights of the mesh (see getVertexWeights()).
+# The mesh has no bulk setter for them, but VertexGroup.add() sets a weight for a whole list of verts at once,
+# so the mesh is given a temporary object, and each group is set once for every distinct weight it has (usually only a few).
+def setVertexWeights(mesh, verts, groups, weights):
+    tempObj = bpy.data.objects.new("SolidWireWeights", mesh)
+    try:
+        # The weights refer to the groups by index, so the groups are only placeholders (the object's own groups name them on export).
+        vertexGroups = [tempObj.vertex_groups.new() for _ in range(int(groups.max()) + 1)]
+        pairs, inverse = numpy.unique(numpy.stack([groups.astype(numpy.float64), weights.astype(numpy.float64)], axis=1), axis=0, return_inverse=True)
+        order = numpy.argsort(inverse.reshape(-1), kind="stable")
+        starts = numpy.searchsorted(inverse.reshape(-1)[order], numpy.arange(len(pairs) + 1))
+        for i, (g, w) in enumerate(pairs.tolist()):
+            vertexGroups[int(g)].add(verts[order[starts[i]:starts[i + 1]]].tolist(), w, 'REPLACE')
+    finally:
+        bpy.data.objects.remove(tempObj)
+
+# Returns a hash of everything that affects the SolidWire encoding of an (evaluated, but not yet processed) mesh:
+# its vertex positions, topology, edge smooth/seam flags, material colors, vertex group weights and the exporter's options.
+def hashMesh(mesh, matColors, options):
+    h = hashlib.blake2b(digest_size=20)
+    h.update(struct.pack("<4I", CACHE_VERSION, len(mesh.vertices), len(mesh.edges), len(mesh.polygons)))
+
+    def update(collection, attr, count, dtype):
+        values = numpy.empty(count, dtype=dtype)
+        collection.foreach_get(attr, values)
+        h.update(values.tobytes())
+
+    update(mesh.vertices, "co", len(mesh.vertices) * 3, numpy.float32)
+    update(mesh.edges, "vertices", len(mesh.edges) * 2, numpy.int32)
+    update(mesh.edges, "use_edge_sharp", len(mesh.edges), bool)
+    update(mesh.edges, "use_seam", len(mesh.edges), bool)
+    update(mesh.loops, "vertex_index", len(mesh.loops), numpy.int32)
+    update(mesh.polygons, "loop_total", len(mesh.polygons), numpy.int32)
+    update(mesh.polygons, "material_index", len(mesh.polygons), numpy.int32)
+
+    h.update(numpy.array(matColors, dtype=numpy.float32).tobytes())
+    for a in getVertexWeights(mesh):
+        h.update(a.tobytes())
+    h.update(repr(sorted(options.items())).encode("utf-8"))
+
+    return h.hexdigest()
+
+# Returns the arrays needed to recreate a processed SolidWire mesh (see setMeshArrays()), along with its tri adjacencies
+# and its packed "EDGE" section (if it has one; see export_edges).
+def getMeshArrays(mesh, triAdjs, edges=b""):
+    co = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("co", co)
+    loopVerts = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get("vertex_index", loopVerts)
+    smooth = numpy.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+    uvs = numpy.empty(len(mesh.loops) * 2, dtype=numpy.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", uvs)
+    uv1s = numpy.empty(len(mesh.loops) * 2 if INDEX_UV_NAME in mesh.uv_layers else 0, dtype=numpy.float32)
+    if len(uv1s):
+        mesh.uv_layers[INDEX_UV_NAME].data.foreach_get("uv", uv1s)
+    colors = numpy.empty(len(mesh.loops) * 4, dtype=numpy.float32)
+    mesh.vertex_colors.active.data.foreach_get("color", colors)
+    weightVerts, weightGroups, weights = getVertexWeights(mesh)
+
+    return {
+        "co": co,
+        "loopVerts": loopVerts,
+        "smooth": smooth,
+        "uvs": uvs,
+        "uv1s": uv1s,
+        "colors": colors,
+        "weightVerts": weightVerts,
+        "weightGroups": weightGroups,
+        "weights": weights,
+        "triAdjs": numpy.asarray(triAdjs, dtype=numpy.int32),
+        "edges": numpy.frombuffer(edges, dtype=numpy.uint8),
+    }
+
+# Replaces all of the mesh's geometry with the arrays returned by getMeshArrays().
+# Returns the mesh's tri vert indexes and tri adjacencies (see encoding.getTriAdjacency()).
+def setMeshArrays(mesh, arrays):
+    loopVerts = arrays["loopVerts"]
+    loopCount = len(loopVerts)
+    polyCount = loopCount // 3
+
+    mesh.clear_geometry()
+    mesh.vertices.add(len(arrays["co"]) // 3)
+    mesh.vertices.foreach_set("co", arrays["co"])
+    mesh.loops.add(loopCount)
+    mesh.loops.foreach_set("vertex_index", loopVerts)
+    mesh.polygons.add(polyCount)
+    mesh.polygons.foreach_set("loop_start", numpy.arange(0, loopCount, 3, dtype=numpy.int32))
+    mesh.polygons.foreach_set("loop_total", numpy.full(polyCount, 3, dtype=numpy.int32))
+    mesh.polygons.foreach_set("use_smooth", arrays["smooth"])
+    mesh.update(calc_edges=True)
+
+    if len(arrays["weights"]):
+        setVertexWeights(mesh, arrays["weightVerts"], arrays["weightGroups"], arrays["weights"])
+
+    mesh.uv_layers.new()
+    mesh.uv_layers.active.data.foreach_set("uv", arrays["uvs"])
+    if len(arrays["uv1s"]):
+        setIndexUvs(mesh, arrays["uv1s"])
+    mesh.vertex_colors.new()
+    mesh.vertex_colors.active.data.foreach_set("color", arrays["colors"])
+    mesh.materials.clear()
+
+    return loopVerts, arrays["triAdjs"]
+
+# Returns the sections of an object in the .swmesh file (see swmesh.packObject()), from its processed mesh.
+# axes converts Blender's axes to Unity's (see getUnityAxes()), and adjacency and edges are the object's packed "ADJ " and "EDGE" sections.
+def getSwmeshSections(obj, mesh, axes, adjacency, edges=None):
+    def get(collection, attr, count, dtype):
+        values = numpy.empty(count, dtype=dtype)
+        collection.foreach_get(attr, values)
+        return values
+
+    mesh.calc_normals()
+    vertCount = len(mesh.vertices)
+    loopCount = len(mesh.loops)
+    co = get(mesh.vertices, "co", vertCount * 3, numpy.float32).reshape(-1, 3)
+    normals = get(mesh.vertices, "normal", vertCount * 3, numpy.float32).reshape(-1, 3)
+
+    # With the space transform baked into the mesh (the same as bake_space_transform for the .fbx),
+    # the object's matrix becomes axes @ matrix @ axes^-1 so that the world positions are unchanged.
+    rotation = axes[:3, :3]
+    matrix = axes @ numpy.array(obj.matrix_world) @ numpy.linalg.inv(axes)
+    normals = normals @ rotation.T
+    normals /= numpy.maximum(numpy.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+
+    weightVerts, weightGroups, weights = getVertexWeights(mesh)
+    return packObject(
+        matrix, co @ rotation.T, normals,
+        get(mesh.loops, "vertex_index", loopCount, numpy.int32),
+        get(mesh.uv_layers.active.data, "uv", loopCount * 2, numpy.float32),
+        get(mesh.vertex_colors.active.data, "color", loopCount * 4, numpy.float32),
+        adjacency,
+        [g.name for g in obj.vertex_groups], weightVerts, weightGroups, weights,
+        edges,
+    )
+
+# Returns the vert, edge and face counts of the mesh (for the profile report).
+def getMeshCounts(mesh):
+    return {"verts": len(mesh.vertices), "edges": len(mesh.edges), "faces": len(mesh.polygons)}
+
+# Returns the cProfile stats (as text) of processing an exported object's mesh a second time, the same way the export did:
+# restoring it from the cache if it was cached (see setMeshArrays()), or building it with the export's options (see buildSolidWireMesh()).
+# mesh is an unprocessed copy of the object's mesh, and is processed in place. The encoding is profiled in Blender's own process,
+# even if the export encoded the mesh in a pool of processes (see parallel.py).
+def profileObject(mesh, cachedArrays, matColors, packIndexes, optimizeOrder, encodeOptions):
+    profile = cProfile.Profile()
+    if cachedArrays is not None:
+        profile.runcall(setMeshArrays, mesh, cachedArrays)
+    else:
+        profile.runcall(buildSolidWireMesh, mesh, matColors, packIndexes=packIndexes, optimizeOrder=optimizeOrder, **encodeOptions)
+
+    out = StringIO()
+    pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+    return out.getvalue()
+
+# Returns the peak memory (resident set size, in bytes) of Blender and of the largest of its finished child processes
+# (e.g. the encoding processes, see parallel.py), or None where it can't be measured (on Windows).
+def getPeakMemory():
+    if not resource:
+        return None
+
+    # ru_maxrss is in kilobytes on Linux, and bytes on macOS.
+    unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "blender": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+        "processes": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit,
+    }
+
+# Used to prevent printing the FBX export to console.
+class NullIO(StringIO):
+    def write(self, txt):
+       pass
+
+
+class EXPORT_OT_SolidWireFBX(Operator, ExportHelper):
+    """Export to SolidWire FBX"""      # Use this as a tooltip for menu items and buttons.
+    bl_idname = "export_scene.solidwire_fbx"        # Unique identifier for buttons and menu items to reference.
+    bl_label = "SolidWire FBX"         # Display name in the interface.
+    bl_options = {'REGISTER', 'UNDO'}  # Enable undo for the operator.
+
+    # ExportHelper mixin class uses this
+    filename_ext = ".fbx"
+
+    # List of operator properties, the attributes will be assigned
+    # to the class instance from the operator settings before calling.
+
+    filter_glob: StringProperty(
+        default="*.fbx",
+        options={'HIDDEN'},
+        maxlen=255,  # Max internal buffer length, longer would be clamped.
+    )
+
+    global_scale: FloatProperty(
+        name="Scale",
+        description="Scale multi?",
+        default=1.0,
+    )
+
+    use_subsurf: BoolProperty(
+        name="Use Subsurf",
+        description="Use Subsurf?",
+        default=False,
+    )
+    
+    use_selection: BoolProperty(
+        name="Selected only",
+        description="Export only selected objects?",
+        default=True,
+    )
+
+    output_format: EnumProperty(
+        name="Format",
+        description="What to write the SolidWire meshes to",
+        items=(
+            ('FBX', "FBX", "Export with the FBX exporter (plus the sidecar file)"),
+            ('SWMESH', "SolidWire Mesh", "Write the meshes straight to a .swmesh file (imported by SolidWireMeshImporter in Unity). Much faster, but only the meshes, their transforms and vertex group weights are written"),
+        ),
+        default='FBX',
+    )
+
+    vertex_layout: EnumProperty(
+        name="Vertex Layout",
+        description="How each vert's mesh index is stored in its UVs",
+        items=(
+            ('FLOAT', "Float Index", "Store the mesh index in UV0.x (Unity's mesh compression must be off)"),
+            ('PACKED', "Packed Index", "Split the mesh index across UV0.x and UV1 so it survives half precision UVs (Unity's mesh compression can be turned on)"),
+        ),
+        default='FLOAT',
+    )
+
+    fake_edge_epsilon: FloatProperty(
+        name="Fake Edge Distance",
+        description="Tris with two verts no further apart than this are treated as converted loose edges, and their two other edges are never drawn",
+        default=0.0,
+        min=0.0,
+        precision=6,
+    )
+
+    cull_angle: FloatProperty(
+        name="Flat Edge Angle",
+        description="Never draw the smooth edges between tris of the same material whose normals are no more than this far apart (they can't be silhouettes). 0 keeps every edge",
+        subtype='ANGLE',
+        default=0.0,
+        min=0.0,
+        max=math.pi,
+    )
+
+    optimize_order: BoolProperty(
+        name="Optimize Vertex Order",
+        description="Reorder the tris and verts of each mesh for the GPU's vertex cache (the mesh indexes in the UVs follow the new order). "
+                    "The sidecar tells Unity to keep this order rather than optimize the mesh again. Slower to export",
+        default=False,
+    )
+
+    minimise_verts: BoolProperty(
+        name="Minimise Vertex Count",
+        description="Choose which tri of each sharp edge draws it (and the colors of hidden edges) so that as many corners as possible share a vert in Unity. "
+                    "Adds to the encoding time of meshes with many sharp edges",
+        default=True,
+    )
+
+    share_instances: BoolProperty(
+        name="Share Linked Duplicates",
+        description="Process the mesh of objects that share mesh data (and have no modifiers other than armatures) once, and export it once for all of them",
+        default=True,
+    )
+
+    batch_static: BoolProperty(
+        name="Merge Static Objects",
+        description="Merge the selected objects that aren't deformed by an armature (or animated) into a single object, so they're rendered with one draw call and one set of SolidWire buffers",
+        default=False,
+    )
+
+    batch_name: StringProperty(
+        name="Merged Name",
+        description="Name of the merged object",
+        default="SolidWireBatch",
+    )
+
+    lod_count: IntProperty(
+        name="LODs",
+        description="Number of decimated LOD levels to export for each object (as _LOD0.._LODn children, which Unity puts in a LODGroup). Sharp, seam and loose edges are kept",
+        default=0,
+        min=0,
+        max=8,
+    )
+
+    lod_ratio: FloatProperty(
+        name="LOD Ratio",
+        description="Ratio of the faces each LOD level keeps from the level before it",
+        default=0.5,
+        min=0.01,
+        max=1.0,
+    )
+
+    export_adjacency: BoolProperty(
+        name="Export Adjacency",
+        description="Write the tri adjacencies to a sidecar file next to the .fbx (so Unity doesn't need to calculate them on import)",
+        default=True,
+    )
+
+    export_edges: BoolProperty(
+        name="Export Edge Buffer",
+        description="Also write a list of every edge (its verts, type, tris and color) for Unity to upload as an edge buffer, so each edge can be drawn once. "
+                    "The adjacencies are always written with it",
+        default=False,
+    )
+
+    use_cache: BoolProperty(
+        name="Use Cache",
+        description="Reuse the encoded meshes of objects that haven't changed since they were last exported",
+        default=True,
+    )
+
+    cache_dir: StringProperty(
+        name="Cache Directory",
+        description="Where encoded meshes are cached (leave empty to use the temporary directory)",
+        subtype='DIR_PATH',
+        default="",
+    )
+
+    cache_size: IntProperty(
+        name="Cache Size (MB)",
+        description="Once the cache grows beyond this size, the least recently used meshes are removed from it",
+        default=512,
+        min=1,
+    )
+
+    encode_processes: IntProperty(
+        name="Encoding Processes",
+        description="Number of processes the meshes are encoded in at once (0 uses one per CPU). Small exports are always encoded in Blender's process",
+        default=0,
+        min=0,
+        max=256,
+    )
+
+    low_memory: BoolProperty(
+        name="Low Memory",
+        description="Encode the corners of each mesh in chunks, so the peak memory stays close to the size of the encoded UVs and vertex colors (slightly slower)",
+        default=False,
+    )
+
+    use_profiling: BoolProperty(
+        name="Write Profile",
+        description="Write a JSON report of the time spent in each stage of the export (for each object) next to the .fbx",
+        default=False,
+    )
+
+    profile_slowest: BoolProperty(
+        name="Profile Slowest Object",
+        description="Add a cProfile of the slowest object to the profile report (the object is processed a second time to profile it, "
+                    "so a copy of each object's mesh is kept until the export ends)",
+        default=False,
+    )
+
+    apply_unit_scale: BoolProperty(
+        name="Apply Unit Scale",
+        description="Apply Unit Scale",
+        default=True,
+    )
+    
+    axis_forward: EnumProperty(
+        name="Forward",
+        description="Forward",
+        items={
+            ('X', 'X', 'X'), 
+            ('Y', 'Y', 'Y'), 
+            ('Z', 'Z', 'Z'), 
+            ('-X', '-X', '-X'), 
+            ('-Y', '-Y', '-Y'), 
+            ('-Z', '-Z', '-Z')
+        },
+        default='Z'
+    )
+    
+    axis_up: EnumProperty(
+        name="Up",
+        description="Up",
+        items={
+            ('X', 'X', 'X'), 
+            ('Y', 'Y', 'Y'), 
+            ('Z', 'Z', 'Z'), 
+            ('-X', '-X', '-X'), 
+            ('-Y', '-Y', '-Y'), 
+            ('-Z', '-Z', '-Z')
+        },
+        default='Y'
+    )
+
+
+    # LODs are only exported to the .fbx (Unity only sets up LODGroups for models).
+    def useLods(self):
+        return self.lod_count > 0 and self.output_format == 'FBX'
+
+    # Creates the LOD meshes of each object (see getDecimatedMesh()), and the objects they're exported with (see createLodObjects()).
+    # The new meshes are added to tempMeshes, the created objects to tempObjs, and the renamed objects (with their names) to renamedObjs
+    # (so they can all be cleaned up, even if this fails).
+    # Returns the objects to export, their meshes and their material colors.
+    def createLods(self, context, objs, meshes, matColorsList, tempObjs, renamedObjs, tempMeshes):
+        exportObjs = []
+        exportMeshes = []
+        exportMatColors = []
+        lodChains = {} # The LOD meshes of each mesh (objects that share a mesh share its LOD meshes as well).
+        for obj, mesh, matColors in zip(objs, meshes, matColorsList):
+            lodMeshes = lodChains.get(mesh.as_pointer())
+            if lodMeshes is None:
+                lodMeshes = [mesh]
+                for level in range(1, self.lod_count + 1):
+                    lodMeshes.append(getDecimatedMesh(context, obj, mesh, self.lod_ratio ** level))
+                    tempMeshes.append(lodMeshes[-1])
+                lodChains[mesh.as_pointer()] = lodMeshes
+
+            name = obj.name
+            renamedObjs.append((obj, name))
+            empty, lodObjs = createLodObjects(context, obj, name, lodMeshes)
+            tempObjs.append(empty)
+            tempObjs.extend(lodObjs)
+
+            exportObjs.extend(lodObjs)
+            exportMeshes.extend(lodMeshes)
+            exportMatColors.extend([matColors] * len(lodObjs))
+
+        return exportObjs, exportMeshes, exportMatColors
+
+    # Merges the static objects (see isStatic()) into a single (temporary) object, so they're rendered with one draw and one set of buffers.
+    # The new mesh is added to tempMeshes, and the new object to tempObjs.
+    # Returns the objects to export (the objects that aren't static, then the merged object), their meshes and their material colors.
+    def batchStatic(self, context, objs, meshes, matColorsList, tempObjs, tempMeshes):
+        static = [i for i, o in enumerate(objs) if isStatic(o)]
+        if len(static) < 2:
+            return objs, meshes, matColorsList
+
+        # Merging changes the meshes, so the objects that share a mesh (see share_instances) are each given a copy of it.
+        staticMeshes = []
+        for i in static:
+            mesh = meshes[i]
+            if sum(m == mesh for m in meshes) > 1:
+                mesh = mesh.copy()
+                tempMeshes.append(mesh)
+            staticMeshes.append(mesh)
+
+        merged, palette = mergeMeshes(self.batch_name, [objs[i] for i in static], staticMeshes, [matColorsList[i] for i in static])
+        tempMeshes.append(merged)
+        batchObj = bpy.data.objects.new(self.batch_name, merged)
+        context.scene.collection.objects.link(batchObj)
+        tempObjs.append(batchObj)
+
+        print("Merged %i static objects into \"%s\"." % (len(static), batchObj.name))
+        rest = [i for i in range(len(objs)) if i not in static]
+        return (
+            [objs[i] for i in rest] + [batchObj],
+            [meshes[i] for i in rest] + [merged],
+            [matColorsList[i] for i in rest] + [palette],
+        )
+
+    # The angle smooth edges are culled below (see cull_angle), or None if they aren't culled.
+    def getCullAngle(self):
+        return self.cull_angle if self.cull_angle > 0 else None
+
+    # Number of corners encoded at once (see low_memory and encoding.encode()).
+    def getEncodeOptions(self):
+        return dict(fakeEpsilon=self.fake_edge_epsilon, cullAngle=self.getCullAngle(), minimiseVerts=self.minimise_verts,
+                    buildEdges=self.export_edges, chunkSize=self.getChunkSize())
+
+    def getChunkSize(self):
+        return LOW_MEMORY_CHUNK_SIZE if self.low_memory else 0
+
+    # The .swmesh importer doesn't compress the meshes, so the packed index layout is only used for the .fbx.
+    def packIndexes(self):
+        return self.vertex_layout == 'PACKED' and self.output_format == 'FBX'
+
+    # Returns the (4, 4) matrix that converts Blender's axes (and scale) to Unity's, from the axis and scale options.
+    def getUnityAxes(self, context):
+        scale = self.global_scale * (context.scene.unit_settings.scale_length if self.apply_unit_scale else 1.0)
+        axes = numpy.identity(4)
+        axes[:3, :3] = numpy.array(axis_conversion(to_forward=self.axis_forward, to_up=self.axis_up)) * scale
+        return axes
+
+    # Returns the exported object that took the longest to process (see objReports), or None if there were none.
+    def getSlowest(self, objReports):
+        return max(objReports, key=lambda r: r["seconds"], default=None)
+
+    # Profiles the slowest of the exported objects (see profile_slowest), and returns the stats as text,
+    # or a note saying why it couldn't be profiled.
+    def profileSlowest(self, objInfos, objReports):
+        slowest = self.getSlowest(objReports)
+        info = next((i for i in objInfos if slowest and not i["sharedWith"] and i["obj"].name == slowest["name"]), None)
+        if not info or not info.get("profileMesh"):
+            return "Not profiled: no processed object was found to profile."
+
+        try:
+            return profileObject(info["profileMesh"], info["arrays"], info["matColors"], self.packIndexes(), self.optimize_order, self.getEncodeOptions())
+        except Exception as e:
+            print("SolidWire couldn't profile \"%s\": %s" % (slowest["name"], e))
+            return "Not profiled: %s" % e
+
+    # Writes the profile report next to the .fbx (see use_profiling).
+    # profile is the cProfile stats of the slowest object, if it was profiled (see profileSlowest()).
+    def writeProfile(self, timer, objReports, seconds, profile=None):
+        slowest = self.getSlowest(objReports)
+        report = {
+            "file": self.filepath,
+            "date": datetime.datetime.now().isoformat(),
+            "blender": bpy.app.version_string,
+            "options": {k: getattr(self, k) for k in self.__annotations__ if k != 'filter_glob'},
+            "seconds": seconds,
+            "stages": timer.seconds,
+            "peakMemory": getPeakMemory(),
+            "slowest": slowest["name"] if slowest else None,
+            "objects": objReports,
+        }
+        if profile is not None:
+            report["profile"] = profile
+
+        path = os.path.splitext(self.filepath)[0] + PROFILE_EXT
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+        if report["peakMemory"]:
+            print("SolidWire peak memory: %.1f MiB (Blender), %.1f MiB (encoding processes)." % (
+                report["peakMemory"]["blender"] / 2 ** 20, report["peakMemory"]["processes"] / 2 ** 20))
+
+        if slowest:
+            stage = max(slowest["stages"].items(), key=lambda s: s[1], default=("", 0.0))
+            self.report({'INFO'}, "SolidWire profile written to %s (slowest: \"%s\", %.3fs, mostly %s)." % (path, slowest["name"], slowest["seconds"], stage[0]))
+
+    def execute(self, context):        # execute() is called when running the operator.
+
+        print("---------------------------------------")
+        print("--          SolidWireExport          --")
+        print("---------------------------------------")
+
+        selectedObjs = [o for o in context.selected_objects if o.type == 'MESH']
+
+        # The original data of each object is swapped with its SolidWire mesh during the export, and swapped back afterwards.
+        originalData = []
+        mutedModifiers = []
+        tempMeshes = []
+        tempObjs = []   # The empties and LOD objects created for LOD chains (see createLodObjects()).
+        renamedObjs = []
+        cache = None
+
+        # When profiling, each stage of the export is timed (per object), and written to a report next to the .fbx.
+        exportStart = time.perf_counter()
+        timer = StageTimer() if self.use_profiling else NULL_TIMER
+        objReports = []
+        profile = None          # The cProfile stats of the slowest object (see profile_slowest).
+        profileSeconds = 0.0    # The time taken to profile it, which isn't part of the export.
+        acmrTotals = [0, 0.0, 0.0] # Tris, and tris * ACMR before and after reordering (see optimize_order).
+        vertTotals = [0, 0]         # Unity verts before and after minimising (see minimise_verts).
+        culledTotal = 0             # Smooth edges culled (see cull_angle).
+
+        try:
+            with timer.stage("evaluate"):
+                evaluatedMeshes = getEvaluatedMeshes(context, selectedObjs, self.share_instances)
+                tempMeshes.extend(dict.fromkeys(evaluatedMeshes))
+            sidecarObjs = []
+
+            # The objects that are exported, their meshes and their material colors.
+            # - With batching, the static objects are exported as a single merged object instead.
+            # - With LODs, each object is exported as an empty with a child for each of its LOD meshes instead.
+            exportObjs = selectedObjs
+            exportMeshes = evaluatedMeshes
+            matColorsList = [getMaterialColors(o) for o in selectedObjs]
+            if self.batch_static:
+                with timer.stage("batch"):
+                    exportObjs, exportMeshes, matColorsList = self.batchStatic(context, exportObjs, exportMeshes, matColorsList, tempObjs, tempMeshes)
+            if self.useLods():
+                with timer.stage("lods"):
+                    exportObjs, exportMeshes, matColorsList = self.createLods(context, exportObjs, exportMeshes, matColorsList, tempObjs, renamedObjs, tempMeshes)
+
+            if self.use_cache:
+                cache = ExportCache(bpy.path.abspath(self.cache_dir) or DEFAULT_CACHE_DIR, self.cache_size * 1024 * 1024)
+
+            # Every option (other than where to export to and how to cache) is part of an object's cache key.
+            # output_format isn't, but the index layout it leads to is (the .swmesh is never packed; see packIndexes()).
+            options = {k: getattr(self, k) for k in self.__annotations__ if k not in NON_CACHE_OPTIONS}
+            options["packIndexes"] = self.packIndexes()
+
+            # Each object is processed in 3 passes, so that the encoding (which doesn't need bpy) can be done in a pool of processes:
+            # 1. Restore the cached objects, and prepare the meshes of the rest (see prepareSolidWireMesh()).
+            # 2. Encode the prepared meshes (see parallel.encodeMeshes()).
+            # 3. Write the encoded meshes back (see finishSolidWireMesh()).
+            # Objects that share a mesh (see share_instances) only process it for the first of them.
+            objInfos = []
+            meshInfos = {}
+            for obj, mesh, matColors in zip(exportObjs, exportMeshes, matColorsList):
+                objStart = time.perf_counter()
+                sharedWith = meshInfos.get(mesh.as_pointer())
+                if sharedWith:
+                    print("Object \"%s\" shares the mesh of \"%s\"." % (obj.name, sharedWith["obj"].name))
+                    objInfos.append(dict(obj=obj, mesh=mesh, sharedWith=sharedWith))
+                    continue
+
+                info = dict(
+                    obj=    obj,
+                    mesh=   mesh,
+                    matColors=matColors,
+                    timer=  StageTimer() if self.use_profiling else NULL_TIMER,
+                    stats=  {} if self.use_profiling or self.optimize_order or self.minimise_verts else None,
+                    before= getMeshCounts(mesh),
+                    key=    None,
+                    arrays= None,   # The cached arrays of the object (see getMeshArrays()), if it was cached.
+                    job=    None,   # The encoding.encode() arguments of the object, if it wasn't cached.
+                    sharedWith=None,# The info of the object whose mesh this object shares.
+                    profileMesh=None,# An unprocessed copy of the mesh, to profile the object afterwards (see profile_slowest).
+                )
+                objInfos.append(info)
+                meshInfos[mesh.as_pointer()] = info
+
+                # The mesh is processed in place, so it's copied before it's processed, in case it's the slowest to profile.
+                if self.use_profiling and self.profile_slowest:
+                    info["profileMesh"] = mesh.copy()
+                    tempMeshes.append(info["profileMesh"])
+
+                # Reuse the encoded mesh if the object hasn't changed since it was last exported.
+                if cache:
+                    with info["timer"].stage("cacheLoad"):
+                        info["key"] = hashMesh(mesh, matColors, options)
+                        info["arrays"] = cache.load(info["key"])
+
+                if info["arrays"] is not None:
+                    print("Object \"%s\" unchanged (cached)." % obj.name)
+                    with info["timer"].stage("cacheRestore"):
+                        info["triVerts"], info["triAdjs"] = setMeshArrays(mesh, info["arrays"])
+                        info["edges"] = info["arrays"]["edges"].tobytes()
+                else:
+                    print("Processing object \"%s\"." % obj.name)
+                    arrays = prepareSolidWireMesh(mesh, self.optimize_order, info["timer"], info["stats"])
+                    info["job"] = dict(matColors=matColors, **self.getEncodeOptions(), **arrays)
+
+                info["seconds"] = time.perf_counter() - objStart
+
+            encodeInfos = [info for info in objInfos if info["job"]]
+            with timer.stage("encodeMeshes"):
+                results = parallel.encodeMeshes([info["job"] for info in encodeInfos], self.encode_processes, self.use_profiling)
+
+            for info, (encoded, encodeSeconds) in zip(encodeInfos, results):
+                objStart = time.perf_counter()
+                objStats = info["stats"]
+                info["triVerts"], info["triAdjs"] = finishSolidWireMesh(info["mesh"], info["job"], encoded, self.packIndexes(), info["timer"], objStats)
+                info["edges"] = packEdges(encoded.edgeRecords) if encoded.edgeRecords is not None else b""
+                if cache:
+                    with info["timer"].stage("cacheStore"):
+                        cache.store(info["key"], getMeshArrays(info["mesh"], info["triAdjs"], info["edges"]))
+
+                # The encoding stages were timed in the process that encoded the mesh.
+                for stage, seconds in (encodeSeconds or {}).items():
+                    info["timer"].seconds[stage] = info["timer"].seconds.get(stage, 0.0) + seconds
+                    info["timer"].counts[stage] = info["timer"].counts.get(stage, 0) + 1
+                info["seconds"] += time.perf_counter() - objStart + sum((encodeSeconds or {}).values())
+
+                triCount = len(info["triVerts"]) // 3
+                if objStats and "acmrAfter" in objStats:
+                    print("Object \"%s\" vertex cache ACMR: %.3f -> %.3f." % (info["obj"].name, objStats["acmrBefore"], objStats["acmrAfter"]))
+                    acmrTotals[0] += triCount
+                    acmrTotals[1] += triCount * objStats["acmrBefore"]
+                    acmrTotals[2] += triCount * objStats["acmrAfter"]
+
+                if objStats and "unityVertsAfter" in objStats:
+                    print("Object \"%s\" Unity verts: %i -> %i." % (info["obj"].name, objStats["unityVertsBefore"], objStats["unityVertsAfter"]))
+                    vertTotals[0] += objStats["unityVertsBefore"]
+                    vertTotals[1] += objStats["unityVertsAfter"]
+
+                culledTotal += encoded.culledEdges
+                if encoded.culledEdges:
+                    print("Object \"%s\" culled edges: %i." % (info["obj"].name, encoded.culledEdges))
+
+            sharedInfos = [info for info in objInfos if info["sharedWith"]]
+            if sharedInfos:
+                stats = "SolidWire shared %i object(s)' meshes with linked duplicates." % len(sharedInfos)
+                print(stats)
+                self.report({'INFO'}, stats)
+
+            for info in objInfos:
+                if info["sharedWith"]:
+                    sections = info["sharedWith"]["sections"]
+                else:
+                    sections = [(b"ADJ ", packAdjacency(info["triVerts"], info["triAdjs"]))]
+                    if self.packIndexes():
+                        sections.append((b"LAYT", packLayout(encoding.PACK_BASE)))
+                    if info["edges"]:
+                        sections.append((b"EDGE", info["edges"]))
+                    if self.optimize_order:
+                        sections.append((b"ORDR", packOrder(reorder.DEFAULT_CACHE_SIZE)))
+                info["sections"] = sections
+                sidecarObjs.append((info["obj"].name, sections))
+
+                if self.use_profiling and not info["sharedWith"]:
+                    objReports.append(dict(
+                        name=       info["obj"].name,
+                        cached=     info["arrays"] is not None,
+                        seconds=    info["seconds"],
+                        stages=     info["timer"].seconds,
+                        before=     info["before"],
+                        after=      getMeshCounts(info["mesh"]),
+                        **info["stats"]
+                    ))
+
+            # The .swmesh file holds everything the .fbx and sidecar would (see swmesh.py), and is written without the FBX exporter.
+            if self.output_format == 'SWMESH':
+                with timer.stage("swmesh"):
+                    axes = self.getUnityAxes(context)
+                    writeSwmesh(os.path.splitext(self.filepath)[0] + SWMESH_EXT, [
+                        (obj.name, getSwmeshSections(obj, mesh, axes, sections[0][1], dict(sections).get(b"EDGE")))
+                        for obj, mesh, (name, sections) in zip(exportObjs, exportMeshes, sidecarObjs)
+                    ])
+            else:
+                # The sidecar is written before the .fbx, so it's already there when Unity imports the .fbx.
+                # It's always needed for the packed index layout (so Unity knows the mesh indexes are packed), for the edge buffer,
+                # and for the optimized order (so Unity doesn't optimize the mesh again).
+                # Unity matches the edge buffer's tris to its own through the adjacencies, so they're always written with the edge buffer.
+                if self.export_adjacency or self.packIndexes() or self.export_edges or self.optimize_order:
+                    with timer.stage("sidecar"):
+                        writeSidecar(os.path.splitext(self.filepath)[0] + SIDECAR_EXT, [
+                            (name, [s for s in sections if self.export_adjacency or self.export_edges or s[0] != b"ADJ "])
+                            for name, sections in sidecarObjs
+                        ])
+
+                for obj, mesh in zip(exportObjs, exportMeshes):
+
+                    # The LOD and merged objects were created with their SolidWire mesh.
+                    if obj in tempObjs:
+                        continue
+
+                    # Swapping the data resizes the object's material slots, so remember any materials linked to the object itself.
+                    objMaterials = [(i, s.material) for i, s in enumerate(obj.material_slots) if s.link == 'OBJECT']
+                    originalData.append((obj, obj.data, objMaterials))
+                    obj.data = mesh
+
+                    # The modifiers have already been applied to the mesh, so they mustn't be applied (or exported) a second time.
+                    for modifier in obj.modifiers:
+                        if modifier.type not in MODIFIERS_TO_IGNORE and (modifier.show_viewport or modifier.show_render):
+                            mutedModifiers.append((modifier, modifier.show_viewport, modifier.show_render))
+                            modifier.show_viewport = False
+                            modifier.show_render = False
+
+                # Export
+                # -----------------------------------------------------------------
+                # Prevent bpy.ops.export_scene.fbx from filling the console with its prints.
+                if HIDE_FBX_LOGS == True:
+                    temp = sys.stdout
+                    sys.stdout = NullIO()
+
+                try:
+                    # Only the processed objects are exported (the selection itself is left untouched).
+                    with timer.stage("fbx"):
+                        bpy.ops.export_scene.fbx(
+                            {"selected_objects": exportObjs + [o for o in tempObjs if o.type == 'EMPTY']},
+                            filepath=           self.filepath,
+                            use_selection=      self.use_selection,
+                            global_scale=       self.global_scale, 
+                            apply_unit_scale=   self.apply_unit_scale, 
+                            use_subsurf=        self.use_subsurf,
+
+                            use_mesh_modifiers= False, # Non-armature modifiers have already been applied.
+                            use_metadata=       True, 
+                            axis_forward=       self.axis_forward, 
+                            axis_up=            self.axis_up,
+
+                            # These two settings ensure the best chance that the FBX is imported into Unity correctly.
+                            apply_scale_options='FBX_SCALE_UNITS',
+                            bake_space_transform=True,
+                        )
+                finally:
+                    # Re-enable printing to console.
+                    if HIDE_FBX_LOGS == True:
+                        sys.stdout = temp
+
+            # The slowest object is processed a second time (under cProfile), so the timings above aren't affected by it.
+            # It's profiled before the cleanup, while the LOD and merged objects it may be one of still exist.
+            if self.use_profiling and self.profile_slowest:
+                profileStart = time.perf_counter()
+                profile = self.profileSlowest(objInfos, objReports)
+                profileSeconds = time.perf_counter() - profileStart
+
+        except Exception as e:
+
+            # Show the error message.
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+
+        finally:
+
+            # Cleanup
+            # -----------------------------------------------------------------
+            # Revert all of the temporary changes made to the objects, and remove the temporary meshes.
+            for modifier, showViewport, showRender in mutedModifiers:
+                modifier.show_viewport = showViewport
+                modifier.show_render = showRender
+
+            for obj, data, objMaterials in originalData:
+                obj.data = data
+                for i, material in objMaterials:
+                    obj.material_slots[i].link = 'OBJECT'
+                    obj.material_slots[i].material = material
+
+            # (The merged object may have been renamed for its LODs, but it's removed anyway).
+            renamedObjs = [(o, name) for o, name in renamedObjs if o not in tempObjs]
+            for obj in tempObjs:
+                bpy.data.objects.remove(obj)
+            restoreLodNames(renamedObjs)
+
+            for mesh in tempMeshes:
+                bpy.data.meshes.remove(mesh)
+
+        if cache:
+            stats = "SolidWire cache: %i hit(s), %i miss(es), %i evicted." % (cache.hits, cache.misses, cache.evictions)
+            print(stats)
+            self.report({'INFO'}, stats)
+
+        if acmrTotals[0]:
+            stats = "SolidWire vertex cache ACMR: %.3f -> %.3f." % (acmrTotals[1] / acmrTotals[0], acmrTotals[2] / acmrTotals[0])
+            print(stats)
+            self.report({'INFO'}, stats)
+
+        if self.getCullAngle() is not None:
+            stats = "SolidWire culled %i flat edge(s)." % culledTotal
+            print(stats)
+            self.report({'INFO'}, stats)
+
+        if vertTotals[0]:
+            stats = "SolidWire verts: %i -> %i (%.1f%% fewer)." % (vertTotals[0], vertTotals[1], 100.0 * (vertTotals[0] - vertTotals[1]) / vertTotals[0])
+            print(stats)
+            self.report({'INFO'}, stats)
+
+        if self.use_profiling:
+            self.writeProfile(timer, objReports, time.perf_counter() - exportStart - profileSeconds, profile)
+
+        return {'FINISHED'}            # Lets Blender know the operator finished successfully.
+
+
+
+def menu_func(self, context):
+    self.layout.operator(EXPORT_OT_SolidWireFBX.bl_idname)
+
+# Registration
+classes = (
+    EXPORT_OT_SolidWireFBX,
+)
+
+def register():
+    from bpy.utils import register_class
+    for cls in classes:
+        register_class(cls)
+
+    bpy.types.TOPBAR_MT_file_export.prepend(menu_func)
+
+def unregister():
+    from bpy.utils import unregister_class
+    for cls in reversed(classes):
+        unregister_class(cls)
+
+    bpy.types.TOPBAR_MT_file_export.remove(menu_func)
+
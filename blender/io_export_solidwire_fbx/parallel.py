@@ -0,0 +1,75 @@
+import concurrent.futures
+import contextlib
+import multiprocessing
+import os
+import sys
+
+from . import encoding
+from .timing import StageTimer, NULL_TIMER
+
+'''
+    Description:
+    ============
+    Encodes the meshes of an export in a pool of processes (see encodeMeshes()).
+    Only encoding.encode() runs in the pool: everything that uses bpy stays on Blender's main thread,
+    which reads the arrays of every mesh first, and writes the encoded UVs and vertex colors back afterwards.
+    Nothing in here uses bpy, so the pool's processes only import the Blender-independent modules of this package.
+
+    Processes:
+    ==========
+    The processes are spawned (not forked), as forking all of Blender isn't safe. Spawned processes normally re-import the __main__ script,
+    which would re-run (or fail to import bpy in) any script that runs the export with blender --python, so the __main__ script is hidden
+    from them while the pool is used (see hiddenMainScript()). They only need this package, which they import by name.
+    If the pool can't be used, the meshes are encoded in Blender's process instead.
+'''
+
+# Below this many tris (in total), starting the pool takes longer than encoding the meshes in Blender's process.
+MIN_POOL_TRIS = 50000
+
+# Returns the number of tris of a job (its "tris" are the vert index of each of the tris' corners, 3 per tri).
+def getTriCount(job):
+    return len(job["tris"]) // 3
+
+# Encodes a single mesh. job is the keyword arguments of encoding.encode() (other than the timer).
+# Returns the EncodedMesh, and the seconds spent in each of its stages (or None if timed isn't set).
+def encodeJob(job, timed=False):
+    timer = StageTimer() if timed else NULL_TIMER
+    encoded = encoding.encode(timer=timer, **job)
+    return encoded, timer.seconds if timed else None
+
+# Returns the number of processes to encode the jobs with (processes is the requested number, or 0 for one per CPU).
+def getProcessCount(jobs, processes=0):
+    if sum(getTriCount(job) for job in jobs) < MIN_POOL_TRIS:
+        return 1
+    return max(1, min(processes or os.cpu_count() or 1, len(jobs)))
+
+# Hides the __main__ script from the processes spawned while this is used, so they don't re-import it (see "Processes" above).
+# The spawned processes re-import __main__ by its module spec or, without one, its path, so both are removed until this is done.
+@contextlib.contextmanager
+def hiddenMainScript():
+    main = sys.modules["__main__"]
+    spec = getattr(main, "__spec__", None)
+    path = main.__dict__.pop("__file__", None)
+    main.__spec__ = None
+    try:
+        yield
+    finally:
+        main.__spec__ = spec
+        if path is not None:
+            main.__file__ = path
+
+# Encodes every job (see encodeJob()), and returns their results in the same order as the jobs.
+# The meshes with the most tris are started first, so a big mesh isn't left to run on its own at the end.
+def encodeMeshes(jobs, processes=0, timed=False):
+    processCount = getProcessCount(jobs, processes)
+    if processCount > 1:
+        try:
+            order = sorted(range(len(jobs)), key=lambda i: -getTriCount(jobs[i]))
+            with hiddenMainScript(), concurrent.futures.ProcessPoolExecutor(processCount, mp_context=multiprocessing.get_context("spawn")) as pool:
+                futures = {i: pool.submit(encodeJob, jobs[i], timed) for i in order}
+                return [futures[i].result() for i in range(len(jobs))]
+
+        except (concurrent.futures.process.BrokenProcessPool, OSError) as e:
+            print("SolidWire: couldn't encode in %i processes (%s), encoding in this process instead." % (processCount, e))
+
+    return [encodeJob(job, timed) for job in jobs]
@@ -0,0 +1,134 @@
+import collections
+import numpy
+
+'''
+    Description:
+    ============
+    Reorders the tris and verts of a mesh for the GPU's post-transform vertex cache and for memory locality.
+    The tris are ordered with Tipsify (Sander, Nehab & Barczak, "Fast Triangle Reordering for Vertex Locality and Reduced Overdraw", 2007),
+    then the verts are ordered by when they're first used by the reordered tris.
+    Like the encoding module, nothing in here uses bpy.
+
+    ACMR:
+    =====
+    The average cache miss ratio: the number of verts a FIFO vertex cache of cacheSize has to transform, per tri.
+    It ranges from 3 (every vert of every tri is a miss) down to about 0.5 for a large regular grid.
+'''
+
+DEFAULT_CACHE_SIZE = 16
+
+# Returns the ACMR of the tris (see above), simulating a FIFO cache of cacheSize verts.
+def getAcmr(tris, cacheSize=DEFAULT_CACHE_SIZE):
+    tris = numpy.asarray(tris).reshape(-1, 3)
+    if not len(tris):
+        return 0.0
+
+    cache = collections.deque()
+    cached = set()
+    misses = 0
+    for v in tris.ravel().tolist():
+        if v in cached:
+            continue
+
+        misses += 1
+        cache.append(v)
+        cached.add(v)
+        if len(cache) > cacheSize:
+            cached.discard(cache.popleft())
+
+    return misses / len(tris)
+
+# Returns the order to emit the tris in (Tipsify).
+# tris is (tris, 3) vert indexes, and vertCount is the number of verts in the mesh.
+def getTriOrder(tris, vertCount, cacheSize=DEFAULT_CACHE_SIZE):
+    tris = numpy.asarray(tris, dtype=numpy.int64).reshape(-1, 3)
+    triCount = len(tris)
+
+    # The tris that use each vert (vertTris[vertStarts[v]:vertStarts[v + 1]]).
+    flat = tris.ravel()
+    useCounts = numpy.bincount(flat, minlength=vertCount)
+    vertStarts = numpy.concatenate([[0], numpy.cumsum(useCounts)]).tolist()
+    vertTris = (numpy.argsort(flat, kind="stable") // 3).tolist()
+
+    triVerts = tris.tolist()
+    live = useCounts.tolist()   # Number of tris that use each vert that haven't been emitted yet.
+    cacheTime = [0] * vertCount # The time each vert last entered the cache.
+    emitted = [False] * triCount
+    deadEnds = []               # Verts of the emitted tris (to return to when the current vert has no live candidates).
+    time = cacheSize + 1
+    cursor = 0                  # Next vert to try once the dead-end stack is empty.
+    order = []
+
+    vert = 0 if vertCount else -1
+    while vert >= 0:
+        candidates = []
+
+        # Emit all of the vert's tris that haven't been emitted yet.
+        for t in vertTris[vertStarts[vert]:vertStarts[vert + 1]]:
+            if emitted[t]:
+                continue
+
+            for v in triVerts[t]:
+                deadEnds.append(v)
+                candidates.append(v)
+                live[v] -= 1
+
+                # Only verts that aren't still in the cache are (re)transformed.
+                if time - cacheTime[v] > cacheSize:
+                    cacheTime[v] = time
+                    time += 1
+
+            emitted[t] = True
+            order.append(t)
+
+        # The next vert is the candidate that will still be in the cache once all of its live tris have been emitted,
+        # preferring the candidate that's been in the cache the longest (so it's used before it's evicted).
+        vert = -1
+        best = -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = 0
+                if time - cacheTime[v] + 2 * live[v] <= cacheSize:
+                    priority = time - cacheTime[v]
+                if priority > best:
+                    best = priority
+                    vert = v
+
+        # Otherwise go back to the most recently used vert that has live tris, or the next one in index order.
+        if vert < 0:
+            while deadEnds:
+                v = deadEnds.pop()
+                if live[v] > 0:
+                    vert = v
+                    break
+
+        if vert < 0:
+            while cursor < vertCount and live[cursor] == 0:
+                cursor += 1
+            if cursor < vertCount:
+                vert = cursor
+
+    return order
+
+# Returns the order of the verts (by when they're first used by the tris, in the order they're in).
+# Verts that aren't used by any tri are kept at the end.
+def getVertOrder(tris, vertCount):
+    flat = numpy.asarray(tris, dtype=numpy.int64).ravel()
+    firstUse = numpy.full(vertCount, len(flat), dtype=numpy.int64)
+    numpy.minimum.at(firstUse, flat, numpy.arange(len(flat)))
+    return numpy.argsort(firstUse, kind="stable").tolist()
+
+# Returns the new position of each tri and vert (for bmesh's sort()), and the ACMR before and after reordering.
+def reorder(tris, vertCount, cacheSize=DEFAULT_CACHE_SIZE):
+    tris = numpy.asarray(tris, dtype=numpy.int64).reshape(-1, 3)
+    triOrder = getTriOrder(tris, vertCount, cacheSize)
+    vertOrder = getVertOrder(tris[triOrder], vertCount)
+
+    triRanks = numpy.empty(len(tris), dtype=numpy.int64)
+    triRanks[triOrder] = numpy.arange(len(tris))
+    vertRanks = numpy.empty(vertCount, dtype=numpy.int64)
+    vertRanks[vertOrder] = numpy.arange(vertCount)
+
+    acmrBefore = getAcmr(tris, cacheSize)
+    acmrAfter = getAcmr(vertRanks[tris[triOrder]], cacheSize)
+    return triRanks.tolist(), vertRanks.tolist(), acmrBefore, acmrAfter
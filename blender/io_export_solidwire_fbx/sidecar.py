@@ -0,0 +1,67 @@
+import struct
+import numpy
+
+from . import encoding
+
+'''
+    Description:
+    ============
+    Writes the sidecar file that is exported next to the .fbx. It stores data the export script already knows,
+    so that SolidWirePostprocessor in Unity doesn't need to recalculate it (see writeSidecar() for its layout).
+'''
+
+SIDECAR_EXT = ".swdata"
+SIDECAR_VERSION = 1
+
+# Vertex layouts of the "LAYT" section.
+LAYOUT_FLOAT = 0    # The mesh index is stored in UV.x as a float (the default).
+LAYOUT_PACKED = 1   # The mesh index is split across UV0.x, UV1.x and UV1.y (see encoding.PACK_BASE).
+
+# Packs the tri adjacency data of an object into an "ADJ " sidecar section.
+def packAdjacency(triVerts, triAdjs):
+    return (
+        struct.pack("<I", len(triVerts) // 3) +
+        numpy.asarray(triVerts, dtype="<i4").tobytes() +
+        numpy.asarray(triAdjs, dtype="<i4").tobytes()
+    )
+
+# Packs the edge buffer of an object (see encoding.getEdgeRecords()) into an "EDGE" section.
+def packEdges(edgeRecords):
+    return struct.pack("<I", len(edgeRecords)) + numpy.asarray(edgeRecords, dtype=encoding.EDGE_RECORD).tobytes()
+
+# Packs the vertex layout of an object into a "LAYT" section (only written for the packed index layout).
+def packLayout(indexBase):
+    return struct.pack("<II", LAYOUT_PACKED, indexBase)
+
+# Packs an "ORDR" section, which marks an object whose tris and verts were already reordered for the vertex cache (see reorder.py),
+# so Unity doesn't reorder them again on import.
+def packOrder(cacheSize):
+    return struct.pack("<I", cacheSize)
+
+# Writes a file made of named objects, each with a list of tagged sections (the layout of both the sidecar and .swmesh files).
+# objects is a list of (object name, [(4 byte section tag, section bytes), ...]).
+# Layout (little-endian):
+# - 4 byte magic, uint32 version, uint32 object count
+# - For each object: uint32 name length, utf-8 name, uint32 section count
+#   - For each section: 4 byte tag, uint32 section length, section bytes
+def writeContainer(path, magic, version, objects):
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sII", magic, version, len(objects)))
+        for name, sections in objects:
+            nameBytes = name.encode("utf-8")
+            f.write(struct.pack("<I", len(nameBytes)))
+            f.write(nameBytes)
+            f.write(struct.pack("<I", len(sections)))
+            for tag, payload in sections:
+                f.write(struct.pack("<4sI", tag, len(payload)))
+                f.write(payload)
+
+# Writes the sidecar file ("SWDT" magic; see writeContainer()).
+# Sections:
+# - "ADJ ": uint32 tri count, int32[tri count * 3] tri vert indexes, int32[tri count * 3] adjacent tri indexes
+# - "LAYT": uint32 vertex layout (LAYOUT_FLOAT or LAYOUT_PACKED), uint32 index base (see encoding.PACK_BASE)
+# - "EDGE": uint32 edge count, (int32 v0, int32 v1, int32 type, int32 tri0, int32 tri1, float32[4] color)[edge count]
+#           (see encoding.EDGE_RECORD; the vert indexes are mesh indexes, and the tris are exported tri indexes, the same as "ADJ ")
+# - "ORDR": uint32 vertex cache size the tris were reordered for (only written when they were; see packOrder())
+def writeSidecar(path, objects):
+    writeContainer(path, b"SWDT", SIDECAR_VERSION, objects)
@@ -0,0 +1,108 @@
+import struct
+import numpy
+
+from .sidecar import writeContainer
+
+'''
+    Description:
+    ============
+    Writes SolidWire meshes straight to a .swmesh file (imported in Unity by SolidWireMeshImporter), instead of going through the FBX exporter.
+    Only the data the Unity side uses is written, and every array is written as a whole (there are no per-vert or per-tri Python objects).
+
+    Unity space:
+    ============
+    Everything is written in Unity's (left-handed) space: the caller converts the Blender axes to Unity's (with the export's axis options),
+    and packObject() then mirrors X, which also reverses the winding of every tri.
+'''
+
+SWMESH_EXT = ".swmesh"
+SWMESH_VERSION = 1
+MAX_INFLUENCES = 4 # Number of vertex groups each vert can be weighted to (the same as Unity's BoneWeight).
+
+# Mirrors X (Blender is right-handed, Unity is left-handed).
+MIRROR_X = numpy.diag([-1.0, 1.0, 1.0, 1.0])
+
+# Returns the unique corners (corners with the same vert, UV and vertex color become one Unity vert),
+# and the index of each corner's unique corner.
+def weldCorners(uvs, colors):
+    corners = numpy.concatenate([uvs, colors], axis=1)
+    _, first, inverse = numpy.unique(corners, axis=0, return_index=True, return_inverse=True)
+    return first, inverse.reshape(-1)
+
+# Returns the MAX_INFLUENCES vertex groups with the highest weights of each vert, and their (normalized) weights.
+# weightVerts, weightGroups and weights are the vertex group weights of the mesh (see getVertexWeights()).
+def getInfluences(vertCount, weightVerts, weightGroups, weights):
+    influenceGroups = numpy.zeros((vertCount, MAX_INFLUENCES), dtype=numpy.int32)
+    influenceWeights = numpy.zeros((vertCount, MAX_INFLUENCES), dtype=numpy.float32)
+
+    # Sort the weights by vert, then by weight (highest first), and keep the first MAX_INFLUENCES of each vert.
+    order = numpy.lexsort((-weights, weightVerts))
+    weightVerts, weightGroups, weights = weightVerts[order], weightGroups[order], weights[order]
+    rank = numpy.arange(len(weightVerts)) - numpy.searchsorted(weightVerts, weightVerts)
+    keep = rank < MAX_INFLUENCES
+
+    influenceGroups[weightVerts[keep], rank[keep]] = weightGroups[keep]
+    influenceWeights[weightVerts[keep], rank[keep]] = weights[keep]
+
+    totals = influenceWeights.sum(axis=1, keepdims=True)
+    numpy.divide(influenceWeights, totals, out=influenceWeights, where=totals > 0)
+    return influenceGroups, influenceWeights
+
+# Returns the sections of an object in the .swmesh file.
+# - matrix: (4, 4) the object's world matrix, in Unity's axes (but not yet mirrored).
+# - co, normals: (verts, 3) in the object's local space, in Unity's axes (but not yet mirrored).
+# - loopVerts: (corners,) the mesh vert index of each corner (3 per tri).
+# - uvs, colors: (corners, 2), (corners, 4) the encoded UVs and vertex colors of every corner.
+# - adjacency: the packed "ADJ " section of the object (see packAdjacency()).
+# - edges: the packed "EDGE" section of the object (see packEdges()), or None.
+# - groupNames, weightVerts, weightGroups, weights: the vertex group weights (groupNames is empty if there are none).
+# Sections:
+# - "XFRM": float32[16] world matrix (row-major)
+# - "VERT": uint32 vert count, float32[count * 3] positions, float32[count * 3] normals, float32[count * 2] UVs, float32[count * 4] colors
+# - "TRI ": uint32 index count, int32[count] vert indexes (3 per tri)
+# - "SKIN": uint32 group count, (uint32 name length, utf-8 name)[group count],
+#           int32[vert count * MAX_INFLUENCES] group indexes, float32[vert count * MAX_INFLUENCES] weights
+# - "ADJ ", "EDGE": the same as the sidecar's (see packAdjacency() and packEdges())
+def packObject(matrix, co, normals, loopVerts, uvs, colors, adjacency, groupNames=(), weightVerts=None, weightGroups=None, weights=None, edges=None):
+    matrix = MIRROR_X @ numpy.asarray(matrix, dtype=numpy.float64) @ MIRROR_X
+    co = numpy.asarray(co, dtype=numpy.float32).reshape(-1, 3) * (-1, 1, 1)
+    normals = numpy.asarray(normals, dtype=numpy.float32).reshape(-1, 3) * (-1, 1, 1)
+    uvs = numpy.asarray(uvs, dtype=numpy.float32).reshape(-1, 2)
+    colors = numpy.asarray(colors, dtype=numpy.float32).reshape(-1, 4)
+
+    first, cornerIdxs = weldCorners(uvs, colors)
+    verts = numpy.asarray(loopVerts)[first]
+
+    # Mirroring X flips the winding of every tri, so swap their last two corners.
+    tris = cornerIdxs.reshape(-1, 3)[:, [0, 2, 1]]
+
+    sections = [
+        (b"XFRM", matrix.astype("<f4").tobytes()),
+        (b"VERT", b"".join([
+            struct.pack("<I", len(verts)),
+            co[verts].astype("<f4").tobytes(),
+            normals[verts].astype("<f4").tobytes(),
+            uvs[first].astype("<f4").tobytes(),
+            colors[first].astype("<f4").tobytes(),
+        ])),
+        (b"TRI ", struct.pack("<I", tris.size) + tris.astype("<i4").tobytes()),
+    ]
+
+    if len(groupNames):
+        influenceGroups, influenceWeights = getInfluences(len(co), weightVerts, weightGroups, weights)
+        names = b"".join(struct.pack("<I", len(n)) + n for n in (name.encode("utf-8") for name in groupNames))
+        sections.append((b"SKIN", b"".join([
+            struct.pack("<I", len(groupNames)),
+            names,
+            influenceGroups[verts].astype("<i4").tobytes(),
+            influenceWeights[verts].astype("<f4").tobytes(),
+        ])))
+
+    sections.append((b"ADJ ", adjacency))
+    if edges is not None:
+        sections.append((b"EDGE", edges))
+    return sections
+
+# Writes the .swmesh file ("SWMS" magic; see writeContainer()). objects is a list of (object name, packObject() sections).
+def writeSwmesh(path, objects):
+    writeContainer(path, b"SWMS", SWMESH_VERSION, objects)
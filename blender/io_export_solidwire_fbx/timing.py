@@ -0,0 +1,32 @@
+import contextlib
+import time
+
+'''
+    Description:
+    ============
+    Times the stages of the SolidWire export (used by the benchmarks).
+    The export functions take an optional timer, and wrap each of their stages in timer.stage("name").
+    By default they're given NULL_TIMER, which doesn't time anything.
+'''
+
+# Adds up the time spent in each named stage (a stage can be entered more than once, e.g. once per object).
+class StageTimer:
+    def __init__(self):
+        self.seconds = {}
+        self.counts = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+# A timer that doesn't time anything.
+class NullTimer:
+    def stage(self, name):
+        return contextlib.nullcontext()
+
+NULL_TIMER = NullTimer()
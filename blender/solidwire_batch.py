@@ -0,0 +1,215 @@
+import argparse
+import concurrent.futures
+import fnmatch
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import bpy
+
+'''
+    Description:
+    ============
+    Headless batch export of .blend files with the SolidWire FBX exporter.
+    Each .blend file is exported by its own background Blender process (a "worker"), and the workers are run in parallel,
+    so the total export time scales with the number of cores rather than with the number of files.
+
+    Usage:
+    ======
+    blender -b --factory-startup --python blender/solidwire_batch.py -- [options] a.blend b.blend ...
+
+    Options:
+    - --output-dir DIR          Where to write the .fbx files (defaults to next to each .blend file).
+    - --collection NAME         Only export the meshes in this collection (can be given more than once).
+    - --objects GLOB            Only export the meshes with a name matching this glob (can be given more than once).
+    - --jobs N                  Number of worker processes (defaults to the number of cores).
+    - --results FILE            Write the JSON results to this file (defaults to printing them).
+    - --global-scale, --axis-forward, --axis-up, --apply-unit-scale/--no-apply-unit-scale, --use-subsurf
+                                The same options as the exporter itself.
+    If no collections or globs are given, every mesh in the scene is exported.
+
+    Results:
+    ========
+    A JSON object with the settings used, the total wall time, and for each .blend file:
+    its output path, status ("FINISHED", "CANCELLED" or "FAILED"), the exported object names,
+    the time spent exporting inside the worker ("seconds") and the wall time of the whole worker process ("wallSeconds").
+    The process exits with 1 if any of the files failed to export.
+'''
+
+SCRIPT_PATH = os.path.abspath(__file__)
+EXPORTER_DIR = os.path.dirname(SCRIPT_PATH) # The directory containing the io_export_solidwire_fbx package.
+
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(prog="solidwire_batch", description="Batch export .blend files to SolidWire FBX.")
+    parser.add_argument("blends", nargs="+", help=".blend files to export")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--collection", action="append", default=[])
+    parser.add_argument("--objects", action="append", default=[])
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--results", default=None)
+    parser.add_argument("--blender", default=bpy.app.binary_path, help="Blender executable used for the workers")
+
+    # Exporter options.
+    parser.add_argument("--global-scale", type=float, default=1.0)
+    parser.add_argument("--axis-forward", default='Z', choices=['X', 'Y', 'Z', '-X', '-Y', '-Z'])
+    parser.add_argument("--axis-up", default='Y', choices=['X', 'Y', 'Z', '-X', '-Y', '-Z'])
+    parser.add_argument("--apply-unit-scale", dest="apply_unit_scale", action="store_true", default=True)
+    parser.add_argument("--no-apply-unit-scale", dest="apply_unit_scale", action="store_false")
+    parser.add_argument("--use-subsurf", action="store_true", default=False)
+
+    # Used internally when this script is started as a worker (in which case "blends" is the single .blend Blender opened).
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--output", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", default=None, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+# The arguments after "--" are the ones meant for this script (the rest are Blender's).
+def getScriptArgs():
+    return sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+def getOutputPath(blend, outputDir):
+    name = os.path.splitext(os.path.basename(blend))[0] + ".fbx"
+    return os.path.join(outputDir or os.path.dirname(os.path.abspath(blend)), name)
+
+
+# Worker
+# -------------------------------------------------------------------------------
+def loadExporter():
+    sys.path.insert(0, EXPORTER_DIR)
+    module = importlib.import_module("io_export_solidwire_fbx")
+    module.register()
+    return module
+
+# Returns the mesh objects to export (in the given collections and/or matching the given globs).
+def getExportObjects(collections, globs):
+    viewLayerObjs = set(bpy.context.view_layer.objects)
+
+    if collections:
+        objs = [o for name in collections for o in bpy.data.collections[name].all_objects]
+    else:
+        objs = list(bpy.context.scene.objects)
+
+    if globs:
+        objs = [o for o in objs if any(fnmatch.fnmatchcase(o.name, g) for g in globs)]
+
+    # Remove duplicates (an object can be in more than one collection), keeping the order.
+    return [o for o in dict.fromkeys(objs) if o.type == 'MESH' and o in viewLayerObjs]
+
+def runWorker(args):
+    result = {"blend": bpy.data.filepath, "output": args.output, "objects": [], "status": "FAILED"}
+
+    try:
+        loadExporter()
+
+        objs = getExportObjects(args.collection, args.objects)
+        result["objects"] = [o.name for o in objs]
+
+        for o in bpy.context.view_layer.objects:
+            o.select_set(False)
+        for o in objs:
+            o.select_set(True)
+
+        start = time.perf_counter()
+        status = bpy.ops.export_scene.solidwire_fbx(
+            filepath=           args.output,
+            global_scale=       args.global_scale,
+            apply_unit_scale=   args.apply_unit_scale,
+            use_subsurf=        args.use_subsurf,
+            axis_forward=       args.axis_forward,
+            axis_up=            args.axis_up,
+            encode_processes=   1, # The .blend files are already exported in parallel (one per worker).
+        )
+        result["seconds"] = time.perf_counter() - start
+        result["status"] = next(iter(status))
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    with open(args.result_file, "w") as f:
+        json.dump(result, f)
+
+
+# Controller
+# -------------------------------------------------------------------------------
+# Runs a worker Blender process for a single .blend file, and returns its results.
+def exportBlend(blend, args, tempDir, idx):
+    output = getOutputPath(blend, args.output_dir)
+    resultFile = os.path.join(tempDir, "result_%i.json" % idx)
+
+    command = [
+        args.blender, "-b", "--factory-startup", blend, "--python", SCRIPT_PATH, "--",
+        "--worker", blend,
+        "--output", output,
+        "--result-file", resultFile,
+        "--global-scale", repr(args.global_scale),
+        "--axis-forward", args.axis_forward,
+        "--axis-up", args.axis_up,
+        "--apply-unit-scale" if args.apply_unit_scale else "--no-apply-unit-scale",
+    ]
+    if args.use_subsurf:
+        command.append("--use-subsurf")
+    for name in args.collection:
+        command += ["--collection", name]
+    for glob in args.objects:
+        command += ["--objects", glob]
+
+    start = time.perf_counter()
+    process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    wallSeconds = time.perf_counter() - start
+
+    if os.path.exists(resultFile):
+        with open(resultFile) as f:
+            result = json.load(f)
+    else:
+        # The worker didn't get as far as writing its results (e.g. the .blend couldn't be opened).
+        result = {"blend": blend, "output": output, "objects": [], "status": "FAILED", "error": process.stdout[-2000:]}
+
+    result["blend"] = blend
+    result["wallSeconds"] = wallSeconds
+    result["returncode"] = process.returncode
+    return result
+
+def runController(args):
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="solidwire_batch_") as tempDir:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            futures = [pool.submit(exportBlend, blend, args, tempDir, idx) for idx, blend in enumerate(args.blends)]
+            files = [f.result() for f in futures]
+
+    results = {
+        "jobs": args.jobs,
+        "settings": {
+            "global_scale": args.global_scale,
+            "axis_forward": args.axis_forward,
+            "axis_up": args.axis_up,
+            "apply_unit_scale": args.apply_unit_scale,
+            "use_subsurf": args.use_subsurf,
+            "collections": args.collection,
+            "objects": args.objects,
+        },
+        "totalSeconds": time.perf_counter() - start,
+        "files": files,
+    }
+
+    if args.results:
+        with open(args.results, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    return 0 if all(r["status"] == "FINISHED" for r in files) else 1
+
+def main():
+    args = parseArgs(getScriptArgs())
+    if args.worker:
+        runWorker(args)
+    else:
+        sys.exit(runController(args))
+
+if __name__ == "__main__":
+    main()
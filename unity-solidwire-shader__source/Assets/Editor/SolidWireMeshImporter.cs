@@ -0,0 +1,173 @@
+﻿using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using UnityEngine;
+using UnityEngine.Rendering;
+using UnityEditor;
+using UnityEditor.Experimental.AssetImporters;
+
+/// <summary>
+/// Imports the .swmesh files the SolidWire Blender export script writes when its format is set to "SolidWire Mesh" (see io_export_solidwire_fbx/swmesh.py).
+/// Each object in the file becomes a child of the imported GameObject, with the default SolidWire material and a SolidWire component
+/// (set up from the adjacencies stored in the file, the same as SolidWirePostprocessor does for a .fbx and its sidecar).
+/// </summary>
+[ScriptedImporter(1, "swmesh")]
+class SolidWireMeshImporter : ScriptedImporter
+{
+    private const string Magic = "SWMS";
+    private const uint Version = 1;
+    private const int MaxInfluences = 4;
+    private const string DefaultMaterialPath = "Assets/Materials/SolidWireDefault.mat";
+
+    public override void OnImportAsset(AssetImportContext ctx)
+    {
+        var objects = SolidWireSidecar.Read(ctx.assetPath, Magic, Version);
+        if (objects == null)
+        {
+            ctx.LogImportError("Not a valid .swmesh file: " + ctx.assetPath);
+            return;
+        }
+
+        var root = new GameObject(Path.GetFileNameWithoutExtension(ctx.assetPath));
+        var material = AssetDatabase.LoadAssetAtPath<Material>(DefaultMaterialPath);
+
+        foreach (var pair in objects)
+        {
+            var obj = new GameObject(pair.Key);
+            obj.transform.SetParent(root.transform, false);
+            SetTransform(obj.transform, pair.Value.sections["XFRM"]);
+
+            Mesh mesh = CreateMesh(pair.Key, pair.Value);
+            ctx.AddObjectToAsset(pair.Key, mesh);
+
+            // Skinned
+            if (pair.Value.sections.TryGetValue("SKIN", out byte[] skin))
+            {
+                var skinnedMeshRenderer = obj.AddComponent<SkinnedMeshRenderer>();
+                SetSkin(skinnedMeshRenderer, mesh, skin);
+                skinnedMeshRenderer.sharedMaterial = material;
+            }
+
+            // Non-skinned
+            else
+            {
+                obj.AddComponent<MeshFilter>().sharedMesh = mesh;
+                obj.AddComponent<MeshRenderer>().sharedMaterial = material;
+            }
+
+            // Add SolidWire.
+            pair.Value.TryGetAdjacency(out int[] triVerts, out int[] triAdjs);
+            pair.Value.TryGetEdges(out SolidWire.Edge[] edges);
+            obj.AddComponent<SolidWire>().Postprocess(triVerts, triAdjs, 0, edges);
+        }
+
+        ctx.AddObjectToAsset("root", root);
+        ctx.SetMainObject(root);
+    }
+
+    /// <summary>
+    /// Sets the transform from the "XFRM" section (the object's world matrix, row-major).
+    /// </summary>
+    private static void SetTransform(Transform t, byte[] data)
+    {
+        using (var reader = new BinaryReader(new MemoryStream(data)))
+        {
+            float[] values = SolidWireSidecar.ReadFloats(reader, 16);
+            var matrix = new Matrix4x4();
+            for (int i = 0; i < 16; i++) matrix[i / 4, i % 4] = values[i];
+
+            t.localPosition = matrix.GetColumn(3);
+            t.localRotation = matrix.rotation;
+            t.localScale = matrix.lossyScale;
+        }
+    }
+
+    /// <summary>
+    /// Creates the mesh from the "VERT" and "TRI " sections.
+    /// </summary>
+    private static Mesh CreateMesh(string name, SolidWireSidecar.ObjectData objectData)
+    {
+        var mesh = new Mesh();
+        mesh.name = name;
+
+        using (var reader = new BinaryReader(new MemoryStream(objectData.sections["VERT"])))
+        {
+            int vertCount = (int)reader.ReadUInt32();
+            if (vertCount > ushort.MaxValue) mesh.indexFormat = IndexFormat.UInt32;
+
+            float[] positions = SolidWireSidecar.ReadFloats(reader, vertCount * 3);
+            float[] normals = SolidWireSidecar.ReadFloats(reader, vertCount * 3);
+            float[] uvs = SolidWireSidecar.ReadFloats(reader, vertCount * 2);
+            float[] colors = SolidWireSidecar.ReadFloats(reader, vertCount * 4);
+
+            var meshPositions = new Vector3[vertCount];
+            var meshNormals = new Vector3[vertCount];
+            var meshUvs = new Vector2[vertCount];
+            var meshColors = new Color[vertCount];
+            for (int i = 0; i < vertCount; i++)
+            {
+                meshPositions[i] = new Vector3(positions[i * 3], positions[i * 3 + 1], positions[i * 3 + 2]);
+                meshNormals[i] = new Vector3(normals[i * 3], normals[i * 3 + 1], normals[i * 3 + 2]);
+                meshUvs[i] = new Vector2(uvs[i * 2], uvs[i * 2 + 1]);
+                meshColors[i] = new Color(colors[i * 4], colors[i * 4 + 1], colors[i * 4 + 2], colors[i * 4 + 3]);
+            }
+
+            mesh.vertices = meshPositions;
+            mesh.normals = meshNormals;
+            mesh.uv = meshUvs;
+            mesh.colors = meshColors;
+        }
+
+        using (var reader = new BinaryReader(new MemoryStream(objectData.sections["TRI "])))
+        {
+            mesh.SetTriangles(SolidWireSidecar.ReadInts(reader, (int)reader.ReadUInt32()), 0);
+        }
+
+        mesh.RecalculateBounds();
+        return mesh;
+    }
+
+    /// <summary>
+    /// Sets the bone weights from the "SKIN" section.
+    /// The armature itself isn't exported, so a bone is created (at the object's origin) for each vertex group, named after it.
+    /// </summary>
+    private static void SetSkin(SkinnedMeshRenderer renderer, Mesh mesh, byte[] data)
+    {
+        using (var reader = new BinaryReader(new MemoryStream(data)))
+        {
+            int groupCount = (int)reader.ReadUInt32();
+            var bones = new Transform[groupCount];
+            var bindposes = new Matrix4x4[groupCount];
+            for (int i = 0; i < groupCount; i++)
+            {
+                string name = Encoding.UTF8.GetString(reader.ReadBytes((int)reader.ReadUInt32()));
+                bones[i] = new GameObject(name).transform;
+                bones[i].SetParent(renderer.transform, false);
+                bindposes[i] = Matrix4x4.identity;
+            }
+
+            int vertCount = mesh.vertexCount;
+            int[] groups = SolidWireSidecar.ReadInts(reader, vertCount * MaxInfluences);
+            float[] weights = SolidWireSidecar.ReadFloats(reader, vertCount * MaxInfluences);
+
+            var boneWeights = new BoneWeight[vertCount];
+            for (int i = 0; i < vertCount; i++)
+            {
+                int j = i * MaxInfluences;
+                boneWeights[i] = new BoneWeight
+                {
+                    boneIndex0 = groups[j], weight0 = weights[j],
+                    boneIndex1 = groups[j + 1], weight1 = weights[j + 1],
+                    boneIndex2 = groups[j + 2], weight2 = weights[j + 2],
+                    boneIndex3 = groups[j + 3], weight3 = weights[j + 3],
+                };
+            }
+
+            mesh.boneWeights = boneWeights;
+            mesh.bindposes = bindposes;
+            renderer.bones = bones;
+            renderer.rootBone = renderer.transform;
+            renderer.sharedMesh = mesh;
+        }
+    }
+}
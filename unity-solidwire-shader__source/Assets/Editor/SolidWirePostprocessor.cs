@@ -1,11 +1,14 @@
 ﻿using UnityEngine;
 using UnityEditor;
 using System.Collections;
+using System.Collections.Generic;
 
 class SolidWirePostprocessor : AssetPostprocessor
 {
     public Material defaultMaterial;
 
+    private Dictionary<string, SolidWireSidecar.ObjectData> sidecar; // Data written by the Blender export script next to the .fbx (null if there isn't any).
+
     // Good for ensuring the correct settings are applied to the imported meshes.
     // Dunno if this can be used to auto apply stuff or preprocess other data though.
     void OnPreprocessModel()
@@ -18,10 +21,25 @@ class SolidWirePostprocessor : AssetPostprocessor
 
             ModelImporter modelImporter = assetImporter as ModelImporter;
 
+            // Mesh compression stores the UVs at half precision, which only keeps the mesh indexes intact if the Blender export script packed them.
+            sidecar = SolidWireSidecar.Load(assetPath);
+            bool packedIndexes = sidecar != null && sidecar.Count > 0;
+            if (sidecar != null)
+            {
+                foreach (var o in sidecar.Values) packedIndexes &= o.TryGetPackedIndexes(out _);
+            }
+
+            // If the Blender export script already reordered the tris for the vertex cache, keep its order (and the ACMR it reported).
+            bool orderOptimized = sidecar != null && sidecar.Count > 0;
+            if (sidecar != null)
+            {
+                foreach (var o in sidecar.Values) orderOptimized &= o.IsOrderOptimized();
+            }
+
             // The following settings must be used to ensure the SolidWire mesh data gets imported correctly.
-            modelImporter.meshCompression = ModelImporterMeshCompression.Off;       // Mesh Compression
+            modelImporter.meshCompression = packedIndexes ? ModelImporterMeshCompression.Low : ModelImporterMeshCompression.Off; // Mesh Compression
             modelImporter.isReadable = true;                                        // Read/Write Enabled
-            modelImporter.optimizeMeshPolygons = true;                              // Optimize Mesh
+            modelImporter.optimizeMeshPolygons = !orderOptimized;                   // Optimize Mesh
             modelImporter.optimizeMeshVertices = false;                             // Optimize Mesh; Not sure if this is necessary.
             modelImporter.keepQuads = false;                                        // Keep Quads
             modelImporter.weldVertices = false;                                     // Weld Vertices
@@ -69,7 +87,18 @@ class SolidWirePostprocessor : AssetPostprocessor
 
             // Add SolidWire.
             SolidWire solidWire = t.gameObject.AddComponent<SolidWire>();
-            solidWire.Postprocess();
+
+            // Pass on the adjacencies and edge buffer calculated by the Blender export script (if there are any).
+            int[] triVerts = null;
+            int[] triAdjs = null;
+            int indexBase = 0;
+            SolidWire.Edge[] edges = null;
+            var sidecarObject = GetSidecarObject(t);
+            sidecarObject?.TryGetAdjacency(out triVerts, out triAdjs);
+            sidecarObject?.TryGetPackedIndexes(out indexBase);
+            sidecarObject?.TryGetEdges(out edges);
+
+            solidWire.Postprocess(triVerts, triAdjs, indexBase, edges);
         }
 
         // Recurse
@@ -78,8 +107,25 @@ class SolidWirePostprocessor : AssetPostprocessor
         }
     }
 
+    /// <summary>
+    /// Returns the sidecar data exported for the object (or null if there isn't any).
+    /// </summary>
+    private SolidWireSidecar.ObjectData GetSidecarObject(Transform t)
+    {
+        if (sidecar == null) return null;
+        if (sidecar.TryGetValue(t.name, out var objectData)) return objectData;
+
+        // If the .fbx only has one object, Unity names it after the file instead.
+        if (sidecar.Count == 1 && t.parent == null)
+        {
+            foreach (var o in sidecar.Values) return o;
+        }
+        return null;
+    }
+
     void OnPostprocessModel(GameObject g)
     {
+        sidecar = SolidWireSidecar.Load(assetPath);
         ProcessGameObject(g.transform);
     }
 }
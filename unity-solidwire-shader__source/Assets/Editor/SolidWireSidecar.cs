@@ -0,0 +1,165 @@
+﻿using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using UnityEngine;
+
+/// <summary>
+/// Reads the sidecar file the SolidWire Blender export script writes next to the .fbx.
+/// The sidecar stores data the export script already knows (such as the tri adjacencies), so it doesn't need to be recalculated on import.
+/// See writeContainer() and writeSidecar() in io_export_solidwire_fbx/sidecar.py for its layout (the .swmesh files use the same layout).
+/// </summary>
+class SolidWireSidecar
+{
+    public const string Extension = ".swdata";
+    private const string Magic = "SWDT";
+    private const uint Version = 1;
+    private const uint LayoutPacked = 1;
+
+    /// <summary>
+    /// The sections stored for a single object, keyed by their 4 character tag.
+    /// </summary>
+    public class ObjectData
+    {
+        public Dictionary<string, byte[]> sections = new Dictionary<string, byte[]>();
+
+        /// <summary>
+        /// Reads the "ADJ " section.
+        /// </summary>
+        /// <param name="triVerts">Each exported tri's 3 mesh indexes (the same indexes the export script stores in UV.x).</param>
+        /// <param name="triAdjs">Each exported tri's 3 adjacent (exported) tri indexes, or -1 if there's no adjacent tri on an edge.</param>
+        /// <returns>False if the object has no adjacency data.</returns>
+        public bool TryGetAdjacency(out int[] triVerts, out int[] triAdjs)
+        {
+            triVerts = null;
+            triAdjs = null;
+            if (!sections.TryGetValue("ADJ ", out byte[] data)) return false;
+
+            using (var reader = new BinaryReader(new MemoryStream(data)))
+            {
+                int count = (int)reader.ReadUInt32() * 3;
+                triVerts = ReadInts(reader, count);
+                triAdjs = ReadInts(reader, count);
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// Reads the "EDGE" section.
+        /// </summary>
+        /// <param name="edges">Every exported edge, with its (exported) mesh indexes and tri indexes (see SolidWire.Postprocess()).</param>
+        /// <returns>False if the object has no edge buffer.</returns>
+        public bool TryGetEdges(out SolidWire.Edge[] edges)
+        {
+            edges = null;
+            if (!sections.TryGetValue("EDGE", out byte[] data)) return false;
+
+            using (var reader = new BinaryReader(new MemoryStream(data)))
+            {
+                edges = new SolidWire.Edge[reader.ReadUInt32()];
+                for (int i = 0; i < edges.Length; i++)
+                {
+                    int[] ints = ReadInts(reader, 5);
+                    float[] color = ReadFloats(reader, 4);
+                    edges[i] = new SolidWire.Edge
+                    {
+                        v0 = ints[0],
+                        v1 = ints[1],
+                        type = ints[2],
+                        tri0 = ints[3],
+                        tri1 = ints[4],
+                        color = new Vector4(color[0], color[1], color[2], color[3]),
+                    };
+                }
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// Reads the "LAYT" section.
+        /// </summary>
+        /// <param name="indexBase">The base the mesh indexes were split with (see SolidWire.Postprocess()).</param>
+        /// <returns>False if the object's mesh indexes aren't packed (they're stored in UV.x as floats).</returns>
+        public bool TryGetPackedIndexes(out int indexBase)
+        {
+            indexBase = 0;
+            if (!sections.TryGetValue("LAYT", out byte[] data)) return false;
+
+            using (var reader = new BinaryReader(new MemoryStream(data)))
+            {
+                if (reader.ReadUInt32() != LayoutPacked) return false;
+                indexBase = (int)reader.ReadUInt32();
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// Checks for the "ORDR" section.
+        /// </summary>
+        /// <returns>True if the Blender export script already reordered the object's tris for the vertex cache (so Unity shouldn't reorder them).</returns>
+        public bool IsOrderOptimized()
+        {
+            return sections.ContainsKey("ORDR");
+        }
+    }
+
+    /// <summary>
+    /// Loads the sidecar file that belongs to a model.
+    /// </summary>
+    /// <param name="modelPath">Path of the .fbx.</param>
+    /// <returns>The data of each object in the sidecar (keyed by the object's name), or null if the model has no (valid) sidecar.</returns>
+    public static Dictionary<string, ObjectData> Load(string modelPath)
+    {
+        string path = Path.ChangeExtension(modelPath, Extension);
+        if (!File.Exists(path)) return null;
+
+        return Read(path, Magic, Version);
+    }
+
+    /// <summary>
+    /// Reads a file with the sidecar's layout (objects made of tagged sections).
+    /// </summary>
+    /// <param name="path"></param>
+    /// <param name="magic">The 4 characters the file must start with.</param>
+    /// <param name="version">The version the file must have.</param>
+    /// <returns>The data of each object in the file (keyed by the object's name), or null if it doesn't have the given magic and version.</returns>
+    public static Dictionary<string, ObjectData> Read(string path, string magic, uint version)
+    {
+        using (var reader = new BinaryReader(File.OpenRead(path)))
+        {
+            if (Encoding.ASCII.GetString(reader.ReadBytes(4)) != magic) return null;
+            if (reader.ReadUInt32() != version) return null;
+
+            var objects = new Dictionary<string, ObjectData>();
+            uint objectCount = reader.ReadUInt32();
+            for (uint i = 0; i < objectCount; i++)
+            {
+                string name = Encoding.UTF8.GetString(reader.ReadBytes((int)reader.ReadUInt32()));
+
+                var objectData = new ObjectData();
+                uint sectionCount = reader.ReadUInt32();
+                for (uint j = 0; j < sectionCount; j++)
+                {
+                    string tag = Encoding.ASCII.GetString(reader.ReadBytes(4));
+                    objectData.sections[tag] = reader.ReadBytes((int)reader.ReadUInt32());
+                }
+
+                objects[name] = objectData;
+            }
+            return objects;
+        }
+    }
+
+    public static int[] ReadInts(BinaryReader reader, int count)
+    {
+        int[] values = new int[count];
+        for (int i = 0; i < count; i++) values[i] = reader.ReadInt32();
+        return values;
+    }
+
+    public static float[] ReadFloats(BinaryReader reader, int count)
+    {
+        float[] values = new float[count];
+        for (int i = 0; i < count; i++) values[i] = reader.ReadSingle();
+        return values;
+    }
+}
@@ -5,15 +5,29 @@ using UnityEngine;
 
 public class SolidWire : MonoBehaviour
 {
+    /// <summary>
+    /// An edge from the Blender export script's edge buffer (the same layout as its EDGE_RECORD), so each edge can be drawn once.
+    /// </summary>
+    [Serializable]
+    public struct Edge
+    {
+        public int v0, v1;      // Vert indexes (indexes into mesh.vertices once postprocessed).
+        public int type;        // Edge type (-1: never, 0: hide, 1: normal, 2: always).
+        public int tri0, tri1;  // The (up to) two tris that share the edge (or -1).
+        public Vector4 color;   // The color of the edge's material.
+    }
+
     private ComputeBuffer vertsPosRWBuffer; // RWBuffer. Will store the calculated clip pos of all vertices in an array for later use (values are set by the shader).
     [SerializeField][HideInInspector] private ComputeBuffer triIdxBuffer;     // Store each tri's 3 vert indexes (mesh.triangles) as uint3s.
     [SerializeField][HideInInspector] private ComputeBuffer triAdjBuffer;     // Storing each tri's 3 adjacent tri indexes (or -1 if there's no adjacent tri on an edge).
+    private ComputeBuffer edgeBuffer;       // Every edge once (only if the Blender export script wrote an edge buffer).
 
     private Material[] materials;           // Reference to the SolidWire material(s).
 
     // The following are calculated when the mesh is imported.
     [SerializeField][HideInInspector] private uint[] triVerts;      // mesh.triangles.
     [SerializeField][HideInInspector] private int[] triAdjs;        // Array of triangle adjacencies (in groups of 3s).
+    [SerializeField][HideInInspector] private Edge[] edges;         // Edge buffer (or null if there isn't one).
 
     [SerializeField][HideInInspector] private int triIdxCount;
     [SerializeField][HideInInspector] private Mesh mesh;
@@ -65,15 +79,36 @@ public class SolidWire : MonoBehaviour
             mat.SetBuffer("vertsPosBuffer", vertsPosRWBuffer);
         }
 
+        // edgeBuffer
+        // ==========
+        // Store every edge once (with its verts, type, tris and color).
+        if (edges != null && edges.Length > 0)
+        {
+            int edgeStride = System.Runtime.InteropServices.Marshal.SizeOf(typeof(Edge));
+            edgeBuffer = new ComputeBuffer(edges.Length, edgeStride, ComputeBufferType.Default);
+            edgeBuffer.SetData(edges);
+
+            foreach (var mat in materials)
+            {
+                mat.SetBuffer("edgeBuffer", edgeBuffer);
+                mat.SetInt("edgeCount", edges.Length);
+            }
+        }
+
         //Explode();
     }
 
     /// <summary>
     /// Called by the SolidWirePostprocessor.
     /// </summary>
-    public void Postprocess()
+    /// <param name="exportedTriVerts">Tri vert indexes written by the Blender export script (or null if there aren't any).</param>
+    /// <param name="exportedTriAdjs">Tri adjacencies written by the Blender export script (or null if there aren't any).</param>
+    /// <param name="packedIndexBase">If the Blender export script packed the mesh indexes, the base they were split with (0 if they aren't packed).</param>
+    /// <param name="exportedEdges">Edge buffer written by the Blender export script (or null if there isn't one). Only used with the exported adjacencies.</param>
+    public void Postprocess(int[] exportedTriVerts = null, int[] exportedTriAdjs = null, int packedIndexBase = 0, Edge[] exportedEdges = null)
 	{
         mesh = GetMesh(); // Get the mesh and material.
+        edges = null;
 
         triVerts = (uint[])(object)mesh.triangles;
         triIdxCount = triVerts.Length;
@@ -87,10 +122,28 @@ public class SolidWire : MonoBehaviour
          * The Blender script will assign a vert's mesh index to its UV.x value.
          * That way all the verts in mesh.vertices will know their both their UV index, and their index in the mesh.
          */
+        uint[] meshIdxs = GetMeshIndexes(packedIndexBase);
         uint[] meshTris = new uint[triIdxCount];
         for (int i = 0; i < triIdxCount; i++)
         {
-            meshTris[i] = (uint)mesh.uv[triVerts[i]].x;
+            meshTris[i] = meshIdxs[triVerts[i]];
+        }
+
+        // Use the adjacencies the Blender export script already calculated (if they match this mesh).
+        if (exportedTriVerts != null && SetExportedAdjacentTris(meshTris, exportedTriVerts, exportedTriAdjs, out int[] meshTriIdxs))
+        {
+            if (exportedEdges != null && !SetExportedEdges(meshIdxs, meshTriIdxs, exportedEdges))
+            {
+                Debug.LogWarning("SolidWire: the exported edge buffer of \"" + name + "\" doesn't match its mesh, so it was discarded.");
+            }
+            return;
+        }
+
+        // The edge buffer's tris can only be matched to the mesh's through the exported adjacencies.
+        if (exportedEdges != null)
+        {
+            Debug.LogWarning("SolidWire: the exported edge buffer of \"" + name + "\" was discarded, as its exported adjacencies " +
+                (exportedTriVerts == null ? "are missing." : "don't match its mesh."));
         }
 
         // Now, for each tri, find its adjacent vertices.
@@ -100,6 +153,135 @@ public class SolidWire : MonoBehaviour
         }
     }
 
+    /// <summary>
+    /// Returns the mesh index (set by the Blender export script) of every vert.
+    /// Packed indexes are split into 3 digits (UV0.x + UV1.x * base + UV1.y * base^2), each small enough to survive half precision UVs.
+    /// </summary>
+    /// <param name="packedIndexBase">The base the indexes were split with, or 0 if they're stored in UV0.x as is.</param>
+    /// <returns></returns>
+    private uint[] GetMeshIndexes(int packedIndexBase)
+    {
+        Vector2[] uvs = mesh.uv; // (mesh.uv returns a new copy of the array every time it's accessed).
+        Vector2[] uv1s = packedIndexBase > 0 ? mesh.uv2 : null;
+
+        uint indexBase = (uint)packedIndexBase;
+        uint[] meshIdxs = new uint[uvs.Length];
+        for (int i = 0; i < uvs.Length; i++)
+        {
+            uint idx = (uint)Mathf.RoundToInt(uvs[i].x);
+            if (uv1s != null)
+            {
+                idx += ((uint)Mathf.RoundToInt(uv1s[i].x) + (uint)Mathf.RoundToInt(uv1s[i].y) * indexBase) * indexBase;
+            }
+            meshIdxs[i] = idx;
+        }
+        return meshIdxs;
+    }
+
+    /// <summary>
+    /// Fills triAdjs from the adjacencies calculated by the Blender export script.
+    /// Unity may reorder (and rewind) the tris on import, so each of the mesh's tris is matched to its exported tri by its mesh indexes.
+    /// </summary>
+    /// <param name="meshTris">The mesh index (UV.x) of every vert in mesh.triangles.</param>
+    /// <param name="exportedTriVerts"></param>
+    /// <param name="exportedTriAdjs"></param>
+    /// <param name="meshIdxs">Mesh tri of each of the exported tris.</param>
+    /// <returns>False if the exported data doesn't match the mesh (triAdjs will need to be calculated instead).</returns>
+    private bool SetExportedAdjacentTris(uint[] meshTris, int[] exportedTriVerts, int[] exportedTriAdjs, out int[] meshIdxs)
+    {
+        int triCount = triIdxCount / 3;
+        meshIdxs = null;
+        if (exportedTriVerts.Length != triIdxCount || exportedTriAdjs.Length != triIdxCount) return false;
+
+        // Exported tris, keyed by their (sorted) mesh indexes.
+        var exportedTris = new Dictionary<(uint, uint, uint), int>(triCount);
+        for (int i = 0; i < triCount; i++)
+        {
+            exportedTris[SortedTri((uint)exportedTriVerts[i * 3], (uint)exportedTriVerts[i * 3 + 1], (uint)exportedTriVerts[i * 3 + 2])] = i;
+        }
+
+        int[] exportedIdxs = new int[triCount];    // Exported tri of each of the mesh's tris.
+        meshIdxs = new int[triCount];
+        for (int i = 0; i < triCount; i++) meshIdxs[i] = -1;
+
+        for (int i = 0; i < triCount; i++)
+        {
+            if (!exportedTris.TryGetValue(SortedTri(meshTris[i * 3], meshTris[i * 3 + 1], meshTris[i * 3 + 2]), out int e)) return false;
+            if (meshIdxs[e] >= 0) return false; // Two tris share the same verts; they can't be told apart.
+
+            exportedIdxs[i] = e;
+            meshIdxs[e] = i;
+        }
+
+        for (int i = 0; i < triCount; i++)
+        {
+            int e = exportedIdxs[i];
+            for (int j = 0; j < 3; j++)
+            {
+                uint v0 = meshTris[i * 3 + j];
+                uint v1 = meshTris[i * 3 + (j + 1) % 3];
+
+                // Find the same edge on the exported tri.
+                int adj = -1;
+                for (int k = 0; k < 3; k++)
+                {
+                    uint e0 = (uint)exportedTriVerts[e * 3 + k];
+                    uint e1 = (uint)exportedTriVerts[e * 3 + (k + 1) % 3];
+                    if ((e0 == v0 && e1 == v1) || (e0 == v1 && e1 == v0))
+                    {
+                        int exportedAdj = exportedTriAdjs[e * 3 + k];
+                        adj = exportedAdj < 0 ? -1 : meshIdxs[exportedAdj];
+                        break;
+                    }
+                }
+
+                triAdjs[i * 3 + j] = adj;
+            }
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// Fills edges from the edge buffer written by the Blender export script, with its indexes remapped to the mesh's.
+    /// Each vert becomes the first of the mesh's verts with its mesh index (they all share the same position).
+    /// </summary>
+    /// <param name="meshIdxs">The mesh index (UV.x) of every vert in mesh.vertices.</param>
+    /// <param name="meshTriIdxs">Mesh tri of each of the exported tris (see SetExportedAdjacentTris()).</param>
+    /// <param name="exportedEdges"></param>
+    /// <returns>False if the edge buffer doesn't match the mesh (edges is left null).</returns>
+    private bool SetExportedEdges(uint[] meshIdxs, int[] meshTriIdxs, Edge[] exportedEdges)
+    {
+        var verts = new Dictionary<uint, int>(meshIdxs.Length);
+        for (int i = 0; i < meshIdxs.Length; i++)
+        {
+            if (!verts.ContainsKey(meshIdxs[i])) verts[meshIdxs[i]] = i;
+        }
+
+        var remapped = new Edge[exportedEdges.Length];
+        for (int i = 0; i < exportedEdges.Length; i++)
+        {
+            Edge edge = exportedEdges[i];
+            if (!verts.TryGetValue((uint)edge.v0, out edge.v0) || !verts.TryGetValue((uint)edge.v1, out edge.v1)) return false;
+            if (edge.tri0 >= meshTriIdxs.Length || edge.tri1 >= meshTriIdxs.Length) return false;
+
+            edge.tri0 = edge.tri0 < 0 ? -1 : meshTriIdxs[edge.tri0];
+            edge.tri1 = edge.tri1 < 0 ? -1 : meshTriIdxs[edge.tri1];
+            remapped[i] = edge;
+        }
+
+        edges = remapped;
+        return true;
+    }
+
+    private static (uint, uint, uint) SortedTri(uint v0, uint v1, uint v2)
+    {
+        if (v0 > v1) { uint t = v0; v0 = v1; v1 = t; }
+        if (v1 > v2) { uint t = v1; v1 = v2; v2 = t; }
+        if (v0 > v1) { uint t = v0; v0 = v1; v1 = t; }
+        return (v0, v1, v2);
+    }
+
     /// <summary>
     /// FIXME: Could probably be made more efficient.
     /// </summary>
@@ -399,6 +581,12 @@ public class SolidWire : MonoBehaviour
             vertsPosRWBuffer.Dispose();
             triIdxBuffer.Dispose();
             triAdjBuffer.Dispose();
+
+            if (edgeBuffer != null)
+            {
+                edgeBuffer.Release();
+                edgeBuffer = null;
+            }
         /*}
         catch (Exception err)
         {
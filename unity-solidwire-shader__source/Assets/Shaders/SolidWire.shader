@@ -258,7 +258,7 @@
                 float4 diff = o.pos - posExt;
                 o.normal = -normalize(diff);
 
-                o.idxType = (int2)v.uv;
+                o.idxType = (int2)round(v.uv); // Rounded, as the UVs may be stored at half precision (see the packed index layout).
 
                 return o;
             }
@@ -373,7 +373,7 @@
                 o.pos = UnityObjectToClipPos(vert);
 
                 o.idxType.x = (int)v.vertexId; // Store the REAL index of the vert (the index set by the Blender export script is used by .cs only).
-                o.idxType.y = (int)v.uv.y;
+                o.idxType.y = (int)round(v.uv.y);
 
                 o.color = v.color;
 